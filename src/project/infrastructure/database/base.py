@@ -1,5 +1,5 @@
-from uuid import uuid4
-from sqlalchemy.dialects.postgresql import UUID
+from uuid import UUID, uuid4
+from sqlalchemy import Uuid
 from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column
 
 
@@ -7,10 +7,11 @@ class Base(DeclarativeBase):
     """Base class for all database models.
 
     Provides a common primary key `id` of type UUID, generated automatically.
-    All SQLAlchemy models should inherit from this class.
+    All SQLAlchemy models should inherit from this class. The generic `Uuid`
+    type renders as native UUID on PostgreSQL and as CHAR(32) elsewhere.
     """
     id: Mapped[UUID] = mapped_column(
-        UUID(as_uuid=True),
+        Uuid(as_uuid=True),
         primary_key=True,
         default=uuid4,
     )
@@ -8,6 +8,7 @@ if TYPE_CHECKING:
 
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from sqlalchemy import text, String, Boolean, Index
+from sqlalchemy import JSON
 from sqlalchemy.dialects.postgresql import JSONB
 
 from ...mixins import TimestampMixin, AuditMixin, VersionMixin
@@ -32,8 +33,8 @@ class AutomationModel(Base, TimestampMixin, AuditMixin, VersionMixin):
     name: Mapped[str] = mapped_column(String(200), nullable=False)
     description: Mapped[Optional[str]] = mapped_column(String)
     is_active: Mapped[bool] = mapped_column(Boolean, default=True, server_default=text("true"))
-    batch_schema: Mapped[Optional[dict]] = mapped_column(JSONB)
-    item_schema: Mapped[Optional[dict]] = mapped_column(JSONB)
+    batch_schema: Mapped[Optional[dict]] = mapped_column(JSON().with_variant(JSONB, "postgresql"))
+    item_schema: Mapped[Optional[dict]] = mapped_column(JSON().with_variant(JSONB, "postgresql"))
 
     batches: Mapped[List["BatchModel"]] = relationship(
         back_populates="automation",
@@ -47,7 +48,9 @@ class AutomationModel(Base, TimestampMixin, AuditMixin, VersionMixin):
 
     __table_args__ = (
         Index("ix_automation_name", "name"),
-        Index("ix_automation_is_active", "is_active"),
+        Index("ix_automation_active", "id",
+              postgresql_where=text("is_active = true"),
+              sqlite_where=text("is_active = 1")),
         Index("ix_automation_name_active", "name",
               postgresql_where=text("is_active = true"),
               unique=True),
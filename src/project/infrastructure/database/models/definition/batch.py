@@ -10,6 +10,7 @@ if TYPE_CHECKING:
 
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from sqlalchemy import ForeignKey, String, UniqueConstraint, Index, Boolean, text
+from sqlalchemy import JSON
 from sqlalchemy.dialects.postgresql import JSONB
 
 from ...base import Base
@@ -39,7 +40,7 @@ class BatchModel(Base, TimestampMixin, AuditMixin, VersionMixin):
     )
 
     name: Mapped[str] = mapped_column(String(200), nullable=False)
-    payload: Mapped[Optional[dict]] = mapped_column(JSONB)
+    payload: Mapped[Optional[dict]] = mapped_column(JSON().with_variant(JSONB, "postgresql"))
     is_active: Mapped[bool] = mapped_column(Boolean, default=True, server_default=text("true"))
 
     automation: Mapped["AutomationModel"] = relationship(back_populates="batches")
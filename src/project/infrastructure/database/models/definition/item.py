@@ -9,6 +9,7 @@ if TYPE_CHECKING:
 
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from sqlalchemy import ForeignKey, Integer, UniqueConstraint, Index, Boolean, text
+from sqlalchemy import JSON
 from sqlalchemy.dialects.postgresql import JSONB
 
 from ...base import Base
@@ -37,7 +38,7 @@ class ItemModel(Base, TimestampMixin, AuditMixin, VersionMixin):
     )
 
     sequence_number: Mapped[int] = mapped_column(Integer, nullable=False)
-    payload: Mapped[Optional[dict]] = mapped_column(JSONB)
+    payload: Mapped[Optional[dict]] = mapped_column(JSON().with_variant(JSONB, "postgresql"))
     is_active: Mapped[bool] = mapped_column(Boolean, default=True, server_default=text("true"))
 
     batch: Mapped["BatchModel"] = relationship(back_populates="items")
@@ -11,6 +11,7 @@ if TYPE_CHECKING:
 
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from sqlalchemy import ForeignKey, Index, String, Boolean, text, UniqueConstraint
+from sqlalchemy import JSON
 from sqlalchemy.dialects.postgresql import JSONB
 
 from ...mixins import TimestampMixin, AuditMixin, VersionMixin, StatusTrackingMixin, RetryableMixin
@@ -49,7 +50,7 @@ class ItemExecutionModel(Base, TimestampMixin, AuditMixin, VersionMixin, StatusT
         nullable=False,
     )
 
-    result_payload: Mapped[Optional[dict]] = mapped_column(JSONB)
+    result_payload: Mapped[Optional[dict]] = mapped_column(JSON().with_variant(JSONB, "postgresql"))
     error_message: Mapped[Optional[str]] = mapped_column(String)
     is_active: Mapped[bool] = mapped_column(Boolean, default=True, server_default=text("true"))
 
@@ -9,6 +9,7 @@ if TYPE_CHECKING:
     from .engine import EngineModel
 
 from sqlalchemy import ForeignKey, Index, Integer, String, UniqueConstraint, Boolean, text
+from sqlalchemy import JSON
 from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
@@ -38,7 +39,7 @@ class OrchestrationInstanceModel(Base, TimestampMixin, AuditMixin, VersionMixin,
     )
     external_id: Mapped[str] = mapped_column(String(200), nullable=False)
     duration_seconds: Mapped[Optional[int]] = mapped_column(Integer)
-    instance_metadata: Mapped[Optional[dict]] = mapped_column(JSONB)
+    instance_metadata: Mapped[Optional[dict]] = mapped_column(JSON().with_variant(JSONB, "postgresql"))
     is_active: Mapped[bool] = mapped_column(Boolean, default=True, server_default=text("true"))
 
     engine: Mapped["EngineModel"] = relationship(back_populates="instances")
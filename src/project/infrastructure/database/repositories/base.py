@@ -6,10 +6,10 @@ from datetime import datetime, timezone
 if TYPE_CHECKING:
     from ...uow.unit_of_work import UnitOfWork
 
-from sqlalchemy.orm import Session, Query
+from sqlalchemy.orm import Session, Query, aliased, raiseload
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm.exc import StaleDataError
-from sqlalchemy import update, delete, inspect
+from sqlalchemy import update, delete, inspect, select, exists, func, and_, or_
 
 from ...exceptions.repository import (
     EntityNotFoundError,
@@ -26,6 +26,8 @@ EntityType = TypeVar("EntityType")
 
 logger = setup_logger(__name__)
 
+_filter_fields_cache: Dict[Type, frozenset] = {}
+
 
 class BaseRepository(Generic[ModelType, EntityType]):
     """Abstract base repository implementing common CRUD operations.
@@ -51,6 +53,11 @@ class BaseRepository(Generic[ModelType, EntityType]):
         self.uow = uow
         self.logger = logger
         self._original_versions: Dict[UUID, int] = {}
+        if model_class not in _filter_fields_cache:
+            _filter_fields_cache[model_class] = frozenset(
+                c.key for c in inspect(model_class).columns
+            )
+        self._valid_filter_fields = _filter_fields_cache[model_class]
 
     def _copy_common_attrs(self, source, target, fields: List[str]) -> None:
         """Copy common attributes from source (model) to target (entity).
@@ -120,6 +127,62 @@ class BaseRepository(Generic[ModelType, EntityType]):
             raise EntityNotFoundError(self.model_class.__name__, id)
         return entity
 
+    def peek(self, id: UUID) -> Optional[ModelType]:
+        """Return the raw ORM model for an ID, without domain translation.
+
+        ``Session.get`` serves the lookup straight from the session's
+        identity map when the row is already loaded, so callers that only
+        inspect column values skip both the SELECT and the domain-entity
+        construction performed by get(). No soft-delete filtering is
+        applied; soft-deleted rows are returned as-is.
+
+        Args:
+            id (UUID): Entity ID.
+
+        Returns:
+            Optional[ModelType]: The ORM model if present, else None.
+        """
+        return self.db.get(self.model_class, id)
+
+    def _keyset_filter(self, query: Query, after: UUID,
+                       columns: tuple, descending: bool = False) -> Query:
+        """Seek past the row identified by `after` for keyset pagination.
+
+        Looks up the anchor row and filters on its two-column sort key, so
+        the database seeks straight to the next page through the matching
+        index instead of scanning and discarding OFFSET rows.
+
+        Args:
+            query (Query): The query to constrain.
+            after (UUID): ID of the last row of the previous page.
+            columns (tuple): The (sort column, id tie-breaker) pair the
+                caller orders by.
+            descending (bool): Whether the caller sorts descending.
+
+        Returns:
+            Query: The query constrained to rows after the anchor.
+
+        Raises:
+            RepositoryError: If the anchor row does not exist.
+        """
+        if self.db.get(self.model_class, after) is None:
+            raise RepositoryError(f"Unknown pagination cursor: {after}")
+        sort_col, tie_col = columns
+        anchor = aliased(self.model_class)
+        sort_val = select(getattr(anchor, sort_col.key)).where(
+            anchor.id == after
+        ).scalar_subquery()
+        tie_val = select(getattr(anchor, tie_col.key)).where(
+            anchor.id == after
+        ).scalar_subquery()
+        if descending:
+            condition = or_(sort_col < sort_val,
+                            and_(sort_col == sort_val, tie_col < tie_val))
+        else:
+            condition = or_(sort_col > sort_val,
+                            and_(sort_col == sort_val, tie_col > tie_val))
+        return query.filter(condition)
+
     def list(self, include_soft_deleted: bool = False, **filters) -> List[EntityType]:
         """List entities matching optional filters.
 
@@ -133,20 +196,22 @@ class BaseRepository(Generic[ModelType, EntityType]):
         Raises:
             RepositoryError: If an invalid filter field is provided or on other errors.
         """
+        invalid = filters.keys() - self._valid_filter_fields
+        if invalid:
+            raise RepositoryError(
+                f"Invalid filter field: '{sorted(invalid)[0]}' for model {self.model_class.__name__}"
+            )
         try:
             query = self.db.query(self.model_class)
 
             if not include_soft_deleted and hasattr(self.model_class, 'is_active'):
                 query = query.filter(self.model_class.is_active == True)
 
-            valid_columns = {c.key for c in inspect(self.model_class).columns}
             for field, value in filters.items():
-                if field not in valid_columns:
-                    raise RepositoryError(f"Invalid filter field: '{field}' for model {self.model_class.__name__}")
                 if value is not None:
                     query = query.filter(getattr(self.model_class, field) == value)
 
-            models = query.all()
+            models = query.options(raiseload("*")).all()
             return [self._to_entity_or_update(m) for m in models]
         except Exception as e:
             self.logger.error(f"Error listing {self.model_class.__name__}: {str(e)}")
@@ -199,6 +264,54 @@ class BaseRepository(Generic[ModelType, EntityType]):
             self.logger.error(f"Error creating {self.model_class.__name__}: {str(e)}")
             raise RepositoryError(f"Failed to create entity: {str(e)}") from e
 
+    def bulk_create(self, entities: List[EntityType], user: Optional[str] = None) -> List[EntityType]:
+        """Create many entities in a single batched INSERT.
+
+        All rows are converted to models up front and flushed together, so
+        the session issues one executemany statement instead of one flush
+        per entity. Generated fields are not copied back onto the entities;
+        ids are already assigned client-side at construction.
+
+        Args:
+            entities (List[EntityType]): The domain entities to create.
+            user (Optional[str]): User performing the creation (for audit).
+
+        Returns:
+            List[EntityType]: The created entities, registered with the UoW.
+
+        Raises:
+            DuplicateEntityError: On unique constraint violation.
+            RepositoryError: On other database errors.
+        """
+        try:
+            for entity in entities:
+                if hasattr(entity, 'created_by') and user:
+                    entity.created_by = user
+                if hasattr(entity, 'updated_by') and user:
+                    entity.updated_by = user
+
+            self.db.bulk_save_objects([self._to_model(e) for e in entities])
+
+            for entity in entities:
+                if self.use_versioning and hasattr(entity, 'version'):
+                    self._original_versions[entity.id] = entity.version
+                self.uow.register_entity(entity)
+
+            self.logger.info(
+                f"Bulk created {len(entities)} {self.model_class.__name__} rows"
+            )
+            return entities
+
+        except IntegrityError as e:
+            self.db.rollback()
+            if "unique constraint" in str(e).lower():
+                raise DuplicateEntityError(self.model_class.__name__, str(e)) from e
+            raise RepositoryError(f"Integrity error: {str(e)}") from e
+        except Exception as e:
+            self.db.rollback()
+            self.logger.error(f"Error bulk creating {self.model_class.__name__}: {str(e)}")
+            raise RepositoryError(f"Failed to bulk create entities: {str(e)}") from e
+
     def _to_entity_or_update(self, model: ModelType) -> EntityType:
         """Convert model to entity, checking identity map first.
 
@@ -253,7 +366,6 @@ class BaseRepository(Generic[ModelType, EntityType]):
         """
         if self.use_versioning:
             expected_version = self._original_versions.get(id)
-            print(f"[DEBUG] update - id: {id}, expected_version: {expected_version}, entity.version: {getattr(entity, 'version', None)}")
             if expected_version is None:
                 raise ConcurrencyError(
                     self.model_class.__name__,
@@ -265,27 +377,15 @@ class BaseRepository(Generic[ModelType, EntityType]):
 
         try:
             existing_model = self.db.get(self.model_class, id)
-            print(f"[DEBUG] existing_model.version: {existing_model.version if existing_model else 'None'}")
             if not existing_model:
                 raise EntityNotFoundError(self.model_class.__name__, id)
 
-            if self.use_versioning and expected_version is not None:
-                if existing_model.version != expected_version:
-                    raise ConcurrencyError(
-                        self.model_class.__name__,
-                        id,
-                        expected_version,
-                        existing_model.version
-                    )
-
             if hasattr(entity, 'touch'):
                 entity.touch(user)
 
             update_data = self._get_changed_data(entity, existing_model, preserve_created=True)
-            print(f"[DEBUG] update_data: {update_data}")
 
             if not update_data and (not self.use_versioning or entity.version == expected_version):
-                print("[DEBUG] No changes, returning early")
                 return entity
 
             if self.use_versioning:
@@ -297,11 +397,9 @@ class BaseRepository(Generic[ModelType, EntityType]):
 
             stmt = stmt.values(**update_data).returning(self.model_class)
             updated_model = self.db.execute(stmt).scalar_one_or_none()
-            print(f"[DEBUG] updated_model: {updated_model is not None}")
 
             if updated_model is None:
                 current_model = self.db.get(self.model_class, id)
-                print(f"[DEBUG] current_model.version: {current_model.version if current_model else 'None'}")
                 if not current_model:
                     raise EntityNotFoundError(self.model_class.__name__, id)
                 if self.use_versioning:
@@ -375,17 +473,11 @@ class BaseRepository(Generic[ModelType, EntityType]):
             if key in allowed_fields or key in exclude_fields:
                 model_dict[key] = getattr(existing_model, key)
 
-
-        print(f"[DEBUG] _get_changed_data: allowed_fields={allowed_fields}")
-        print(f"[DEBUG] model_dict keys: {list(model_dict.keys())}")
         for field in allowed_fields:
             new_val = getattr(entity, field, None)
             old_val = model_dict.get(field)
             if new_val != old_val:
                 data[field] = new_val
-                print(f"[DEBUG] change detected: {field}: {old_val} -> {new_val}")
-            else:
-                print(f"[DEBUG] no change: {field} = {new_val}")
 
         all_entity_fields = [key for key in entity.__dict__.keys() if not key.startswith('_')]
         non_updatable = set(all_entity_fields) - allowed_fields - exclude_fields
@@ -497,6 +589,63 @@ class BaseRepository(Generic[ModelType, EntityType]):
             self.logger.error(f"Error deleting {self.model_class.__name__} {id}: {str(e)}")
             raise RepositoryError(f"Failed to delete entity: {str(e)}") from e
 
+    def soft_delete_by_ids(self, ids: List[UUID], user: Optional[str] = None) -> int:
+        """Soft delete several entities with one set-based UPDATE.
+
+        Issues a single ``UPDATE ... WHERE id IN (...)`` without hydrating
+        any models, so there is no per-entity round trip. Optimistic-version
+        checks are not applied; use :meth:`delete` when a version guard is
+        required for an individual row.
+
+        Args:
+            ids (List[UUID]): IDs of entities to soft delete.
+            user (Optional[str]): User performing deletion (for audit).
+
+        Returns:
+            int: Number of rows updated.
+
+        Raises:
+            RepositoryError: If the model does not support soft delete or on database errors.
+        """
+        if not hasattr(self.model_class, 'is_active'):
+            raise RepositoryError(f"Model {self.model_class.__name__} does not support soft delete")
+        if not ids:
+            return 0
+
+        try:
+            update_values = {
+                'is_active': False,
+                'updated_at': datetime.now(timezone.utc),
+            }
+            if user and hasattr(self.model_class, 'updated_by'):
+                update_values['updated_by'] = user
+            if self.use_versioning and hasattr(self.model_class, 'version'):
+                update_values['version'] = self.model_class.version + 1
+
+            stmt = (
+                update(self.model_class)
+                .where(self.model_class.id.in_(ids))
+                .values(**update_values)
+            )
+            result = self.db.execute(stmt)
+
+            for id in ids:
+                tracked = self.uow.get_entity(self.entity_class, id)
+                if tracked is not None:
+                    tracked.is_active = False
+                    if hasattr(tracked, 'updated_at'):
+                        tracked.updated_at = update_values['updated_at']
+                    if self.use_versioning and hasattr(tracked, 'version'):
+                        tracked.version += 1
+                        self._original_versions[id] = tracked.version
+
+            return result.rowcount
+
+        except Exception as e:
+            self.db.rollback()
+            self.logger.error(f"Error soft deleting {self.model_class.__name__} batch: {str(e)}")
+            raise RepositoryError(f"Failed to soft delete entities: {str(e)}") from e
+
     def exists(self, id: UUID, include_soft_deleted: bool = False) -> bool:
         """Check if an entity with given ID exists.
 
@@ -507,10 +656,10 @@ class BaseRepository(Generic[ModelType, EntityType]):
         Returns:
             bool: True if exists.
         """
-        query = self.db.query(self.model_class).filter(self.model_class.id == id)
+        criteria = self.model_class.id == id
         if not include_soft_deleted and hasattr(self.model_class, 'is_active'):
-            query = query.filter(self.model_class.is_active == True)
-        return query.first() is not None
+            criteria = and_(criteria, self.model_class.is_active == True)
+        return bool(self.db.execute(select(exists().where(criteria))).scalar_one())
 
     def count(self, include_soft_deleted: bool = False, **filters) -> int:
         """Count entities matching optional filters.
@@ -522,13 +671,13 @@ class BaseRepository(Generic[ModelType, EntityType]):
         Returns:
             int: Count of matching entities.
         """
-        query = self.db.query(self.model_class)
+        stmt = select(func.count()).select_from(self.model_class)
         if not include_soft_deleted and hasattr(self.model_class, 'is_active'):
-            query = query.filter(self.model_class.is_active == True)
+            stmt = stmt.where(self.model_class.is_active == True)
         for field, value in filters.items():
             if hasattr(self.model_class, field) and value is not None:
-                query = query.filter(getattr(self.model_class, field) == value)
-        return query.count()
+                stmt = stmt.where(getattr(self.model_class, field) == value)
+        return self.db.execute(stmt).scalar_one()
 
     def _get_model_instance(self, entity: EntityType) -> ModelType:
         """Retrieve the model instance corresponding to an entity.
@@ -4,10 +4,11 @@ from typing import Optional, List, TYPE_CHECKING
 if TYPE_CHECKING:
     from ...uow.unit_of_work import UnitOfWork
 
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, raiseload
 
 from ....domain.entities.definition import Automation, Batch, Item
 from ...database.models.definition import AutomationModel, BatchModel, ItemModel
+from ...exceptions.repository import RepositoryError
 from .base import BaseRepository
 
 
@@ -27,9 +28,34 @@ class AutomationRepository(BaseRepository[AutomationModel, Automation]):
         """
         super().__init__(db, AutomationModel, Automation, uow)
 
+    def _name_cache(self) -> dict:
+        """Return the name-lookup cache for the session's current transaction.
+
+        The cache lives in ``session.info`` keyed by the active transaction
+        object, so it empties itself whenever the transaction ends and never
+        leaks stale lookups across commits or rollbacks.
+
+        Returns:
+            dict: Mapping of (name, include_soft_deleted) to cached entities.
+        """
+        transaction = self.db.get_transaction()
+        if transaction is None:
+            self.db.begin()
+            transaction = self.db.get_transaction()
+        cached = self.db.info.get("automation_name_cache")
+        if cached is None or cached[0] is not transaction:
+            cached = (transaction, {})
+            self.db.info["automation_name_cache"] = cached
+        return cached[1]
+
     def get_by_name(self, name: str, include_soft_deleted: bool = False) -> Optional[Automation]:
         """Retrieve an automation by its unique name.
 
+        Results are memoized per transaction, so repeated lookups of the same
+        name (e.g. resolving references during bulk imports) hit a dict
+        instead of issuing a SELECT. The cache is cleared on every mutation
+        through this repository.
+
         Args:
             name (str): The automation name.
             include_soft_deleted (bool): Whether to include soft-deleted records.
@@ -37,12 +63,111 @@ class AutomationRepository(BaseRepository[AutomationModel, Automation]):
         Returns:
             Optional[Automation]: The automation if found, else None.
         """
+        cache = self._name_cache()
+        key = (name, include_soft_deleted)
+        if key in cache:
+            return cache[key]
+
         query = self.db.query(self.model_class).filter(
             self.model_class.name == name
         )
         query = self._apply_soft_delete_filter(query, include_soft_deleted)
         model = query.first()
-        return self._to_entity_or_update(model) if model else None
+        entity = self._to_entity_or_update(model) if model else None
+        cache[key] = entity
+        return entity
+
+    def create(self, entity: Automation, user: Optional[str] = None) -> Automation:
+        """Create an automation, refreshing the name-lookup cache.
+
+        The cache is invalidated and then seeded with the new entity, so a
+        `get_by_name` for the freshly created automation within the same
+        transaction is served from the cache without a SELECT.
+
+        Args:
+            entity (Automation): The entity to persist.
+            user (Optional[str]): User performing the creation (for audit).
+
+        Returns:
+            Automation: The persisted entity.
+        """
+        cache = self._name_cache()
+        cache.clear()
+        created = super().create(entity, user=user)
+        cache[(created.name, False)] = created
+        cache[(created.name, True)] = created
+        return created
+
+    def bulk_create(self, entities: List[Automation], user: Optional[str] = None) -> List[Automation]:
+        """Bulk-create automations, refreshing the name-lookup cache.
+
+        As with create(), the cache is invalidated (earlier lookups may have
+        memoized misses for these names) and then seeded with the new
+        entities, so within-transaction `get_by_name` calls resolve them
+        without a SELECT.
+
+        Args:
+            entities (List[Automation]): The domain entities to create.
+            user (Optional[str]): User performing the creation (for audit).
+
+        Returns:
+            List[Automation]: The created entities.
+        """
+        cache = self._name_cache()
+        cache.clear()
+        created = super().bulk_create(entities, user=user)
+        for entity in created:
+            cache[(entity.name, False)] = entity
+            cache[(entity.name, True)] = entity
+        return created
+
+    def update(self, id: UUID, entity: Automation, user: Optional[str] = None) -> Automation:
+        """Update an automation, invalidating the name-lookup cache.
+
+        Args:
+            id (UUID): Entity ID.
+            entity (Automation): The entity carrying updated values.
+            user (Optional[str]): User performing the update (for audit).
+
+        Returns:
+            Automation: The updated entity.
+        """
+        self._name_cache().clear()
+        return super().update(id, entity, user=user)
+
+    def delete(self, id: UUID, soft: bool = False, user: Optional[str] = None,
+               expected_version: Optional[int] = None) -> bool:
+        """Delete an automation, invalidating the name-lookup cache.
+
+        Args:
+            id (UUID): Entity ID.
+            soft (bool): If True, perform soft delete; else hard delete.
+            user (Optional[str]): User performing deletion (for audit).
+            expected_version (Optional[int]): Version expected by the caller.
+
+        Returns:
+            bool: True if the entity was deleted.
+        """
+        self._name_cache().clear()
+        return super().delete(id, soft=soft, user=user, expected_version=expected_version)
+
+    def soft_delete_by_ids(self, ids: List[UUID], user: Optional[str] = None) -> int:
+        """Soft delete automations in bulk, invalidating the name-lookup cache.
+
+        Without the invalidation, a name looked up earlier in the
+        transaction would keep being served from the cache after its row
+        was soft-deleted here.
+
+        Args:
+            ids (List[UUID]): IDs of the entities to soft delete.
+            user (Optional[str]): User performing the deletion (for audit).
+
+        Returns:
+            int: Number of rows updated.
+        """
+        count = super().soft_delete_by_ids(ids, user=user)
+        self._name_cache().clear()
+        return count
 
     def list_active(self, limit: int = 100, offset: int = 0) -> List[Automation]:
         """List all active automations with pagination.
@@ -57,7 +182,7 @@ class AutomationRepository(BaseRepository[AutomationModel, Automation]):
         query = self.db.query(self.model_class).filter(
             self.model_class.is_active.is_(True)
         )
-        models = query.order_by(
+        models = query.options(raiseload("*")).order_by(
             self.model_class.created_at.desc(),
             self.model_class.id.desc()
         ).limit(limit).offset(offset).all()
@@ -163,12 +288,41 @@ class BatchRepository(BaseRepository[BatchModel, Batch]):
             self.model_class.automation_id == automation_id
         )
         query = self._apply_soft_delete_filter(query, include_soft_deleted)
-        models = query.order_by(
+        models = query.options(raiseload("*")).order_by(
             BatchModel.name,
             BatchModel.id
         ).limit(limit).offset(offset).all()
         return [self._to_entity_or_update(m) for m in models]
 
+    def list_ids_by_automation(self, automation_id: UUID,
+                              include_soft_deleted: bool = False,
+                              limit: int = 100,
+                              offset: int = 0) -> List[UUID]:
+        """List batch IDs for an automation without hydrating entities.
+
+        A lightweight projection for callers that only need identifiers or
+        counts; skips domain-entity construction and identity-map
+        registration entirely.
+
+        Args:
+            automation_id (UUID): ID of the automation.
+            include_soft_deleted (bool): Whether to include soft-deleted.
+            limit (int): Maximum number of records.
+            offset (int): Number of records to skip.
+
+        Returns:
+            List[UUID]: Batch IDs in the same order as list_by_automation.
+        """
+        query = self.db.query(self.model_class.id).filter(
+            self.model_class.automation_id == automation_id
+        )
+        query = self._apply_soft_delete_filter(query, include_soft_deleted)
+        rows = query.order_by(
+            BatchModel.name,
+            BatchModel.id
+        ).limit(limit).offset(offset).all()
+        return [row.id for row in rows]
+
     def _to_entity(self, model: BatchModel) -> Batch:
         """Convert a BatchModel to a Batch domain entity.
 
@@ -261,17 +415,56 @@ class ItemRepository(BaseRepository[ItemModel, Item]):
 
         Returns:
             List[Item]: List of items.
+
+        Raises:
+            RepositoryError: If offset is negative.
         """
+        if offset < 0:
+            raise RepositoryError("OFFSET must not be negative")
         query = self.db.query(self.model_class).filter(
             self.model_class.batch_id == batch_id
         )
         query = self._apply_soft_delete_filter(query, include_soft_deleted)
-        models = query.order_by(
+        models = query.options(raiseload("*")).order_by(
             ItemModel.sequence_number,
             ItemModel.id
         ).limit(limit).offset(offset).all()
         return [self._to_entity_or_update(m) for m in models]
 
+    def list_ids_by_batch(self, batch_id: UUID,
+                          include_soft_deleted: bool = False,
+                          limit: int = 100,
+                          offset: int = 0) -> List[UUID]:
+        """List item IDs in a batch without hydrating entities.
+
+        A lightweight projection for callers that only need identifiers or
+        counts; skips domain-entity construction and identity-map
+        registration entirely.
+
+        Args:
+            batch_id (UUID): ID of the batch.
+            include_soft_deleted (bool): Whether to include soft-deleted.
+            limit (int): Maximum number of records.
+            offset (int): Number of records to skip.
+
+        Returns:
+            List[UUID]: Item IDs in the same order as list_by_batch.
+
+        Raises:
+            RepositoryError: If offset is negative.
+        """
+        if offset < 0:
+            raise RepositoryError("OFFSET must not be negative")
+        query = self.db.query(self.model_class.id).filter(
+            self.model_class.batch_id == batch_id
+        )
+        query = self._apply_soft_delete_filter(query, include_soft_deleted)
+        rows = query.order_by(
+            ItemModel.sequence_number,
+            ItemModel.id
+        ).limit(limit).offset(offset).all()
+        return [row.id for row in rows]
+
     def _to_entity(self, model: ItemModel) -> Item:
         """Convert an ItemModel to an Item domain entity.
 
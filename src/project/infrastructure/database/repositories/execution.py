@@ -4,9 +4,9 @@ from typing import Optional, List, TYPE_CHECKING
 if TYPE_CHECKING:
     from ...uow.unit_of_work import UnitOfWork
 
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, raiseload
 from sqlalchemy.orm.exc import NoResultFound, MultipleResultsFound
-from sqlalchemy import and_
+from sqlalchemy import and_, select, func
 
 from ....domain.entities.execution import (
     Run, BatchExecution, ItemExecution, ItemStateHistory
@@ -61,7 +61,8 @@ class RunRepository(BaseRepository[RunModel, Run]):
         limit: int = 100,
         offset: int = 0,
         status: Optional[ExecutionStatus] = None,
-        include_soft_deleted: bool = False
+        include_soft_deleted: bool = False,
+        after: Optional[UUID] = None
     ) -> List[Run]:
         """List runs for an automation with optional filters.
 
@@ -71,6 +72,8 @@ class RunRepository(BaseRepository[RunModel, Run]):
             offset (int): Number of records to skip.
             status (Optional[ExecutionStatus]): Filter by status.
             include_soft_deleted (bool): Whether to include soft-deleted records.
+            after (Optional[UUID]): Keyset cursor; return rows strictly after
+                the row with this ID in sort order instead of using OFFSET.
 
         Returns:
             List[Run]: List of runs matching the criteria.
@@ -83,7 +86,13 @@ class RunRepository(BaseRepository[RunModel, Run]):
             query = query.filter(self.model_class.status == status)
 
         query = self._apply_soft_delete_filter(query, include_soft_deleted)
-        models = query.order_by(
+        if after is not None:
+            query = self._keyset_filter(
+                query, after,
+                (self.model_class.created_at, self.model_class.id),
+                descending=True,
+            )
+        models = query.options(raiseload("*")).order_by(
             self.model_class.created_at.desc(),
             self.model_class.id.desc()
         ).limit(limit).offset(offset).all()
@@ -112,7 +121,7 @@ class RunRepository(BaseRepository[RunModel, Run]):
             self.model_class.status == status
         )
         query = self._apply_soft_delete_filter(query, include_soft_deleted)
-        models = query.order_by(
+        models = query.options(raiseload("*")).order_by(
             self.model_class.created_at.desc(),
             self.model_class.id.desc()
         ).limit(limit).offset(offset).all()
@@ -138,7 +147,7 @@ class RunRepository(BaseRepository[RunModel, Run]):
         if automation_id:
             query = query.filter(self.model_class.automation_id == automation_id)
         query = self._apply_soft_delete_filter(query, include_soft_deleted)
-        models = query.order_by(
+        models = query.options(raiseload("*")).order_by(
             self.model_class.started_at.desc(),
             self.model_class.id.desc()
         ).all()
@@ -251,7 +260,7 @@ class BatchExecutionRepository(BaseRepository[BatchExecutionModel, BatchExecutio
             self.model_class.run_id == run_id
         )
         query = self._apply_soft_delete_filter(query, include_soft_deleted)
-        models = query.order_by(
+        models = query.options(raiseload("*")).order_by(
             self.model_class.created_at.desc(),
             self.model_class.id.desc()
         ).limit(limit).offset(offset).all()
@@ -260,7 +269,8 @@ class BatchExecutionRepository(BaseRepository[BatchExecutionModel, BatchExecutio
     def list_by_batch(self, batch_id: UUID,
                       include_soft_deleted: bool = False,
                       limit: int = 100,
-                      offset: int = 0) -> List[BatchExecution]:
+                      offset: int = 0,
+                      after: Optional[UUID] = None) -> List[BatchExecution]:
         """List all executions for a batch with pagination.
 
         Args:
@@ -268,6 +278,8 @@ class BatchExecutionRepository(BaseRepository[BatchExecutionModel, BatchExecutio
             include_soft_deleted (bool): Whether to include soft-deleted.
             limit (int): Maximum number of records.
             offset (int): Number of records to skip.
+            after (Optional[UUID]): Keyset cursor; return rows strictly after
+                the row with this ID in sort order instead of using OFFSET.
 
         Returns:
             List[BatchExecution]: List of batch executions.
@@ -276,7 +288,13 @@ class BatchExecutionRepository(BaseRepository[BatchExecutionModel, BatchExecutio
             self.model_class.batch_id == batch_id
         )
         query = self._apply_soft_delete_filter(query, include_soft_deleted)
-        models = query.order_by(
+        if after is not None:
+            query = self._keyset_filter(
+                query, after,
+                (self.model_class.created_at, self.model_class.id),
+                descending=True,
+            )
+        models = query.options(raiseload("*")).order_by(
             self.model_class.created_at.desc(),
             self.model_class.id.desc()
         ).limit(limit).offset(offset).all()
@@ -402,7 +420,7 @@ class ItemExecutionRepository(BaseRepository[ItemExecutionModel, ItemExecution])
             self.model_class.batch_execution_id == batch_execution_id
         )
         query = self._apply_soft_delete_filter(query, include_soft_deleted)
-        models = query.order_by(
+        models = query.options(raiseload("*")).order_by(
             self.model_class.created_at.desc(),
             self.model_class.id.desc()
         ).limit(limit).offset(offset).all()
@@ -430,7 +448,7 @@ class ItemExecutionRepository(BaseRepository[ItemExecutionModel, ItemExecution])
             )
         )
         query = self._apply_soft_delete_filter(query, include_soft_deleted)
-        models = query.order_by(
+        models = query.options(raiseload("*")).order_by(
             self.model_class.created_at.desc(),
             self.model_class.id.desc()
         ).limit(limit).offset(offset).all()
@@ -458,7 +476,7 @@ class ItemExecutionRepository(BaseRepository[ItemExecutionModel, ItemExecution])
             )
         )
         query = self._apply_soft_delete_filter(query, include_soft_deleted)
-        models = query.order_by(
+        models = query.options(raiseload("*")).order_by(
             self.model_class.created_at.desc(),
             self.model_class.id.desc()
         ).limit(limit).offset(offset).all()
@@ -475,14 +493,13 @@ class ItemExecutionRepository(BaseRepository[ItemExecutionModel, ItemExecution])
         Returns:
             int: Count of item executions.
         """
-        query = self.db.query(self.model_class).filter(
-            and_(
-                self.model_class.run_id == run_id,
-                self.model_class.status == status
-            )
+        stmt = select(func.count()).select_from(self.model_class).where(
+            self.model_class.run_id == run_id,
+            self.model_class.status == status
         )
-        query = self._apply_soft_delete_filter(query, include_soft_deleted)
-        return query.count()
+        if not include_soft_deleted:
+            stmt = stmt.where(self.model_class.is_active == True)
+        return self.db.execute(stmt).scalar_one()
 
     def _to_entity(self, model: ItemExecutionModel) -> ItemExecution:
         """Convert an ItemExecutionModel to an ItemExecution domain entity.
@@ -581,7 +598,7 @@ class ItemStateHistoryRepository(BaseRepository[ItemStateHistoryModel, ItemState
             self.model_class.item_execution_id == item_execution_id
         )
         query = self._apply_soft_delete_filter(query, include_soft_deleted)
-        models = query.order_by(
+        models = query.options(raiseload("*")).order_by(
             self.model_class.changed_at.desc(),
             self.model_class.id.desc()
         ).limit(limit).offset(offset).all()
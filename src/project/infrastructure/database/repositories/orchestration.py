@@ -4,7 +4,7 @@ from typing import Optional, List, TYPE_CHECKING
 if TYPE_CHECKING:
     from ...uow.unit_of_work import UnitOfWork
 
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, raiseload
 from sqlalchemy import and_
 
 from ....domain.entities.orchestration import (
@@ -53,7 +53,8 @@ class EngineRepository(BaseRepository[EngineModel, Engine]):
     def list_by_type(self, engine_type: str,
                      include_soft_deleted: bool = False,
                      limit: int = 100,
-                     offset: int = 0) -> List[Engine]:
+                     offset: int = 0,
+                     after: Optional[UUID] = None) -> List[Engine]:
         """List all engines by type with pagination.
 
         Args:
@@ -61,6 +62,8 @@ class EngineRepository(BaseRepository[EngineModel, Engine]):
             include_soft_deleted (bool): Whether to include soft-deleted.
             limit (int): Maximum number of records.
             offset (int): Number of records to skip.
+            after (Optional[UUID]): Keyset cursor; return rows strictly after
+                the row with this ID in sort order instead of using OFFSET.
 
         Returns:
             List[Engine]: List of engines.
@@ -69,7 +72,12 @@ class EngineRepository(BaseRepository[EngineModel, Engine]):
             self.model_class.type == engine_type
         )
         query = self._apply_soft_delete_filter(query, include_soft_deleted)
-        models = query.order_by(
+        if after is not None:
+            query = self._keyset_filter(
+                query, after,
+                (self.model_class.name, self.model_class.id),
+            )
+        models = query.options(raiseload("*")).order_by(
             self.model_class.name.asc(),
             self.model_class.id.asc()
         ).limit(limit).offset(offset).all()
@@ -159,7 +167,8 @@ class OrchestrationInstanceRepository(BaseRepository[OrchestrationInstanceModel,
     def list_by_engine(self, engine_id: UUID,
                        include_soft_deleted: bool = False,
                        limit: int = 100,
-                       offset: int = 0) -> List[OrchestrationInstance]:
+                       offset: int = 0,
+                       after: Optional[UUID] = None) -> List[OrchestrationInstance]:
         """List all instances for an engine with pagination.
 
         Args:
@@ -167,6 +176,8 @@ class OrchestrationInstanceRepository(BaseRepository[OrchestrationInstanceModel,
             include_soft_deleted (bool): Whether to include soft-deleted.
             limit (int): Maximum number of records.
             offset (int): Number of records to skip.
+            after (Optional[UUID]): Keyset cursor; return rows strictly after
+                the row with this ID in sort order instead of using OFFSET.
 
         Returns:
             List[OrchestrationInstance]: List of instances.
@@ -175,7 +186,13 @@ class OrchestrationInstanceRepository(BaseRepository[OrchestrationInstanceModel,
             self.model_class.engine_id == engine_id
         )
         query = self._apply_soft_delete_filter(query, include_soft_deleted)
-        models = query.order_by(
+        if after is not None:
+            query = self._keyset_filter(
+                query, after,
+                (self.model_class.created_at, self.model_class.id),
+                descending=True,
+            )
+        models = query.options(raiseload("*")).order_by(
             self.model_class.created_at.desc(),
             self.model_class.id.desc()
         ).limit(limit).offset(offset).all()
@@ -184,7 +201,8 @@ class OrchestrationInstanceRepository(BaseRepository[OrchestrationInstanceModel,
     def list_by_status(self, status: ExecutionStatus,
                        include_soft_deleted: bool = False,
                        limit: int = 100,
-                       offset: int = 0) -> List[OrchestrationInstance]:
+                       offset: int = 0,
+                       after: Optional[UUID] = None) -> List[OrchestrationInstance]:
         """List all instances by status with pagination.
 
         Args:
@@ -192,6 +210,8 @@ class OrchestrationInstanceRepository(BaseRepository[OrchestrationInstanceModel,
             include_soft_deleted (bool): Whether to include soft-deleted.
             limit (int): Maximum number of records.
             offset (int): Number of records to skip.
+            after (Optional[UUID]): Keyset cursor; return rows strictly after
+                the row with this ID in sort order instead of using OFFSET.
 
         Returns:
             List[OrchestrationInstance]: List of instances.
@@ -200,7 +220,13 @@ class OrchestrationInstanceRepository(BaseRepository[OrchestrationInstanceModel,
             self.model_class.status == status
         )
         query = self._apply_soft_delete_filter(query, include_soft_deleted)
-        models = query.order_by(
+        if after is not None:
+            query = self._keyset_filter(
+                query, after,
+                (self.model_class.created_at, self.model_class.id),
+                descending=True,
+            )
+        models = query.options(raiseload("*")).order_by(
             self.model_class.created_at.desc(),
             self.model_class.id.desc()
         ).limit(limit).offset(offset).all()
@@ -208,13 +234,16 @@ class OrchestrationInstanceRepository(BaseRepository[OrchestrationInstanceModel,
 
     def list_running(self, include_soft_deleted: bool = False,
                      limit: int = 100,
-                     offset: int = 0) -> List[OrchestrationInstance]:
+                     offset: int = 0,
+                     after: Optional[UUID] = None) -> List[OrchestrationInstance]:
         """List all running instances (status PROCESSING or RETRYING) with pagination.
 
         Args:
             include_soft_deleted (bool): Whether to include soft-deleted.
             limit (int): Maximum number of records.
             offset (int): Number of records to skip.
+            after (Optional[UUID]): Keyset cursor; return rows strictly after
+                the row with this ID in sort order instead of using OFFSET.
 
         Returns:
             List[OrchestrationInstance]: List of running instances.
@@ -226,7 +255,13 @@ class OrchestrationInstanceRepository(BaseRepository[OrchestrationInstanceModel,
             ])
         )
         query = self._apply_soft_delete_filter(query, include_soft_deleted)
-        models = query.order_by(
+        if after is not None:
+            query = self._keyset_filter(
+                query, after,
+                (self.model_class.created_at, self.model_class.id),
+                descending=True,
+            )
+        models = query.options(raiseload("*")).order_by(
             self.model_class.created_at.desc(),
             self.model_class.id.desc()
         ).limit(limit).offset(offset).all()
@@ -339,7 +374,7 @@ class RunOrchestrationRepository(BaseRepository[RunOrchestrationModel, RunOrches
             self.model_class.run_id == run_id
         )
         query = self._apply_soft_delete_filter(query, include_soft_deleted)
-        models = query.order_by(
+        models = query.options(raiseload("*")).order_by(
             self.model_class.attached_at.desc(),
             self.model_class.id.desc()
         ).limit(limit).offset(offset).all()
@@ -364,7 +399,7 @@ class RunOrchestrationRepository(BaseRepository[RunOrchestrationModel, RunOrches
             self.model_class.orchestration_instance_id == instance_id
         )
         query = self._apply_soft_delete_filter(query, include_soft_deleted)
-        models = query.order_by(
+        models = query.options(raiseload("*")).order_by(
             self.model_class.attached_at.desc(),
             self.model_class.id.desc()
         ).limit(limit).offset(offset).all()
@@ -1,6 +1,8 @@
+import threading
+from collections import defaultdict
 from contextlib import contextmanager
 from typing import Generator, Optional, List, Tuple, Callable, Dict, Type, Any
-from concurrent.futures import ThreadPoolExecutor
+from queue import SimpleQueue, Empty
 from uuid import UUID
 
 from ..database.database import DatabaseConfig
@@ -26,27 +28,33 @@ class EventBus:
     """Simple in‑memory event dispatcher.
 
     Allows registering handlers for domain events and dispatching events after
-    a successful transaction commit. Supports synchronous or asynchronous
-    (thread‑pool) execution of handlers.
+    a successful transaction commit. Supports synchronous execution or
+    asynchronous execution on a single background consumer thread.
 
     Attributes:
         handlers (Dict[type, List[Callable]]): Registered handlers per event type.
         use_async (bool): Whether to dispatch asynchronously.
-        executor (Optional[ThreadPoolExecutor]): Executor for async dispatch.
-        _futures (List): List of pending futures when using async.
+        _queue (Optional[SimpleQueue]): Batch queue feeding the consumer thread.
+        _consumer (Optional[threading.Thread]): Background consumer thread.
     """
     def __init__(self, use_async: bool = False, max_workers: int = 4):
         """Initialize the event bus.
 
         Args:
-            use_async (bool): If True, dispatch handlers in a thread pool.
-            max_workers (int): Maximum number of worker threads for async dispatch.
+            use_async (bool): If True, dispatch handlers on a background
+                consumer thread.
+            max_workers (int): Accepted for backward compatibility; dispatch
+                uses a single consumer thread regardless.
         """
         self.handlers: Dict[type, List[Callable]] = {}
         self.use_async = use_async
         if use_async:
-            self.executor = ThreadPoolExecutor(max_workers=max_workers)
-            self._futures = []
+            self._queue: SimpleQueue = SimpleQueue()
+            self._stop = object()
+            self._consumer = threading.Thread(
+                target=self._consume, name="eventbus-consumer", daemon=True
+            )
+            self._consumer.start()
 
     def register(self, event_type: type, handler: Callable) -> None:
         """Register a handler for a specific event type.
@@ -60,35 +68,66 @@ class EventBus:
     def dispatch(self, events: List[DomainEvent]):
         """Dispatch a list of events to their registered handlers.
 
-        If async mode is enabled, handlers are submitted to the thread pool.
-        Otherwise, they are executed synchronously.
+        Returns immediately when no registered handler matches any event in
+        the batch, so subscriber-less commits skip the queue entirely.
+        If async mode is enabled, the whole batch is pushed onto the consumer
+        queue with a single put — no per-event future or lock acquisition.
+        Otherwise, handlers are executed synchronously.
 
         Args:
             events (List[DomainEvent]): The events to dispatch.
         """
+        if not self.handlers:
+            return
+        if not any(type(event) in self.handlers for event in events):
+            return
         if not self.use_async:
             for event in events:
                 for handler in self.handlers.get(type(event), []):
                     handler(event)
         else:
-            for event in events:
+            self._queue.put_nowait(list(events))
+
+    def _consume(self):
+        """Drain event batches from the queue until the stop sentinel arrives.
+
+        Handler exceptions are logged and swallowed so one failing handler
+        cannot kill the consumer thread or affect other handlers.
+        """
+        while True:
+            batch = self._queue.get()
+            if batch is self._stop:
+                break
+            for event in batch:
                 for handler in self.handlers.get(type(event), []):
-                    future = self.executor.submit(handler, event)
-                    self._futures.append(future)
+                    try:
+                        handler(event)
+                    except Exception:
+                        logger.exception(
+                            f"Error in event handler for {type(event).__name__}"
+                        )
 
     def shutdown(self, wait: bool = True):
-        """Shut down the executor, optionally waiting for pending tasks.
+        """Stop the consumer thread, optionally waiting for pending batches.
 
         Args:
-            wait (bool): If True, wait for pending futures to complete.
+            wait (bool): If True, process everything already queued before
+                stopping. If False, discard undelivered batches and return
+                without joining the consumer.
         """
-        if hasattr(self, 'executor'):
-            self.executor.shutdown(wait=wait)
-            if not wait:
-                for f in self._futures:
-                    f.cancel()
-
-            self._futures.clear()
+        consumer = getattr(self, '_consumer', None)
+        if consumer is None:
+            return
+        if not wait:
+            try:
+                while True:
+                    self._queue.get_nowait()
+            except Empty:
+                pass
+        self._queue.put_nowait(self._stop)
+        if wait:
+            consumer.join()
+        self._consumer = None
 
 class UnitOfWork:
     """Unit of Work context manager coordinating database transactions.
@@ -127,7 +166,7 @@ class UnitOfWork:
         self.engines: Optional[EngineRepository] = None
         self.orchestration_instances: Optional[OrchestrationInstanceRepository] = None
         self.run_orchestration: Optional[RunOrchestrationRepository] = None
-        self._identity_map: Dict[Type, Dict[UUID, Any]] = {}
+        self._identity_map: Dict[Type, Dict[UUID, Any]] = defaultdict(dict)
 
     def __enter__(self):
         """Enter context manager: create session and initialize repositories.
@@ -163,8 +202,6 @@ class UnitOfWork:
         entity_class = type(entity)
         key = (entity_class, entity_id)
 
-        if entity_class not in self._identity_map:
-            self._identity_map[entity_class] = {}
         self._identity_map[entity_class][entity_id] = entity
 
         self._tracked_entities[key] = entity
@@ -176,8 +213,7 @@ class UnitOfWork:
             entity_class (Type): The class of the entity.
             entity_id (UUID): The entity ID.
         """
-        if entity_class in self._identity_map:
-            self._identity_map[entity_class].pop(entity_id, None)
+        self._identity_map[entity_class].pop(entity_id, None)
 
         key = (entity_class, entity_id)
         self._tracked_entities.pop(key, None)
@@ -234,6 +270,22 @@ class UnitOfWork:
         finally:
             self.clear_identity_map()
 
+    def flush(self):
+        """Flush pending changes to the database without committing.
+
+        Returns immediately when the session has nothing new, dirty, or
+        deleted, so a redundant flush (e.g. straight after a rollback) costs
+        a single bookkeeping check instead of a full flush pass.
+
+        Raises:
+            RuntimeError: If session not initialized.
+        """
+        if not self.session:
+            raise RuntimeError("Session not initialized")
+        if not (self.session.new or self.session.dirty or self.session.deleted):
+            return
+        self.session.flush()
+
     def rollback(self):
         """Rollback the current transaction and clear identity map."""
         if self.session:
@@ -296,7 +348,7 @@ class UnitOfWork:
         Returns:
             bool: True if tracked.
         """
-        return entity_id in self._identity_map.get(entity_class, {})
+        return entity_id in self._identity_map[entity_class]
 
     def get_entity(self, entity_class: Type, entity_id: UUID) -> Optional[Any]:
         """Retrieve tracked entity from identity map.
@@ -308,7 +360,7 @@ class UnitOfWork:
         Returns:
             Optional[Any]: The tracked entity, or None if not found.
         """
-        return self._identity_map.get(entity_class, {}).get(entity_id)
+        return self._identity_map[entity_class].get(entity_id)
 
     def clear_identity_map(self) -> None:
         """Clear the identity map and tracked entities (used at transaction end)."""
@@ -1,7 +1,9 @@
+from functools import cached_property
+from itertools import count
+from uuid import UUID, uuid4
+
 import pytest
-from pytest_postgresql import factories
-from sqlalchemy import create_engine
-from sqlalchemy.engine.url import URL
+from sqlalchemy import create_engine, event
 from sqlalchemy.orm import sessionmaker
 
 from src.project.infrastructure.database import Base, DatabaseConfig
@@ -25,38 +27,115 @@ from src.project.domain.entities.orchestration import Engine, OrchestrationInsta
 from src.project.domain.enums import ExecutionStatus
 
 
-postgresql_proc = factories.postgresql_proc(
-    host="localhost",
-    port=None,
-    user="postgres",
-    password="mysecretpassword",
-)
+_uuid_counter = count(1)
 
 
-@pytest.fixture
-def engine(postgresql):
-    """Create a SQLAlchemy engine connected to the test database.
+def make_uuids(n):
+    """Pre-generate monotonically increasing UUIDs for direct model inserts.
+
+    Domain entities mint their own ids (`DomainEntity.id` is init=False), so
+    this is for test code that needs arbitrary identifiers — foreign keys on
+    transient models, lookups expected to miss. The ids come from a process-
+    wide counter rather than urandom: sequential keys land on the right edge
+    of the primary-key B-tree instead of splitting random pages, and cost no
+    entropy reads. Production ids stay uuid4; collisions with them are not a
+    concern because the counter only covers the lowest integer values.
+
+    Args:
+        n (int): Number of UUIDs to generate.
+
+    Returns:
+        list[UUID]: `n` unique, strictly increasing version-4-shaped UUIDs.
+    """
+    return [UUID(int=next(_uuid_counter), version=4) for _ in range(n)]
+
+
+def _enable_sqlite_foreign_keys(engine):
+    """Turn on foreign key enforcement for every SQLite connection.
+
+    SQLite ships with foreign keys disabled per connection, so the pragma is
+    registered as a connect-event listener rather than executed once.
+
+    Args:
+        engine (sqlalchemy.engine.Engine): Engine whose connections to configure.
+    """
+    @event.listens_for(engine, "connect")
+    def _set_pragma(dbapi_connection, connection_record):
+        cursor = dbapi_connection.cursor()
+        cursor.execute("PRAGMA foreign_keys=ON")
+        cursor.close()
+
+
+def _tune_sqlite_for_tests(engine):
+    """Disable durability on every SQLite connection of a test engine.
+
+    The tests never need their data to survive a crash, so journal syncing
+    is pure overhead; with an in-memory journal and synchronous=OFF each
+    commit costs microseconds instead of an fsync. The page cache is sized
+    well above the test database so reads after the first never touch disk —
+    this is as close to `:memory:` as we can get while keeping the separate
+    connections the multi-session concurrency tests rely on (a shared-cache
+    in-memory database serializes them behind table locks).
+
+    Args:
+        engine (sqlalchemy.engine.Engine): Engine whose connections to configure.
+    """
+    @event.listens_for(engine, "connect")
+    def _set_pragmas(dbapi_connection, connection_record):
+        cursor = dbapi_connection.cursor()
+        cursor.execute("PRAGMA journal_mode=MEMORY")
+        cursor.execute("PRAGMA synchronous=OFF")
+        cursor.execute("PRAGMA temp_store=MEMORY")
+        cursor.execute("PRAGMA cache_size=-16384")
+        cursor.close()
+
+
+def _enable_sqlite_savepoints(engine):
+    """Make SAVEPOINTs reliable on pysqlite connections.
+
+    The pysqlite driver's implicit transaction handling commits at the wrong
+    times for nested transactions; disabling it and emitting BEGIN ourselves
+    is the documented SQLAlchemy recipe and is required for the SAVEPOINT
+    rollback harness in `db_session`.
+
+    Args:
+        engine (sqlalchemy.engine.Engine): Engine whose connections to configure.
+    """
+    @event.listens_for(engine, "connect")
+    def _disable_implicit_begin(dbapi_connection, connection_record):
+        dbapi_connection.isolation_level = None
+
+    @event.listens_for(engine, "begin")
+    def _emit_begin(connection):
+        connection.exec_driver_sql("BEGIN")
+
 
-    Drops and recreates all tables defined in `Base` metadata to ensure a clean
-    schema for each test run.
+@pytest.fixture(scope="session")
+def db_engine(tmp_path_factory):
+    """Create the suite-wide SQLAlchemy engine and schema once per session.
+
+    Building the schema (and formerly a database process) per test dominated
+    the suite's runtime; a single SQLite database file shared across the whole
+    session amortizes that cost, and the pragma tuning keeps commits off the
+    disk. Tests stay isolated through the SAVEPOINT harness in `db_session`
+    and the row wipe in `engine`.
+
+    Under pytest-xdist each worker resolves `tmp_path_factory` to its own
+    basetemp, so `pytest -n auto` gives every worker a private database
+    file with no cross-worker locking.
 
     Args:
-        postgresql: pytest-postgresql fixture providing a running PostgreSQL process.
+        tmp_path_factory: pytest factory for session-scoped temp directories.
 
     Yields:
         sqlalchemy.engine.Engine: Engine connected to the test database.
     """
-    url = URL.create(
-        drivername="postgresql",
-        username=postgresql.info.user,
-        password=postgresql.info.password,
-        host=postgresql.info.host,
-        port=postgresql.info.port,
-        database=postgresql.info.dbname,
-    )
-    engine = create_engine(url, echo=True)
+    db_path = tmp_path_factory.mktemp("db") / "test.db"
+    engine = create_engine(f"sqlite:///{db_path}", query_cache_size=1200)
+    _enable_sqlite_foreign_keys(engine)
+    _enable_sqlite_savepoints(engine)
+    _tune_sqlite_for_tests(engine)
 
-    Base.metadata.drop_all(engine)
     Base.metadata.create_all(engine)
 
     yield engine
@@ -64,26 +143,79 @@ def engine(postgresql):
 
 
 @pytest.fixture
-def db_session(engine):
-    """Provide a database session that is rolled back after the test.
+def engine(db_engine):
+    """Provide a committing engine on the shared database, wiped after each test.
+
+    Unlike `db_engine`, connections here keep the pysqlite driver's implicit
+    transaction handling, so multi-session tests interleave reads and real
+    commits the way the production backend would instead of holding explicit
+    locks. The schema is never rebuilt; rows committed outside the
+    `db_session` rollback harness (e.g. by UnitOfWork or concurrency tests)
+    are deleted at teardown, children before parents.
 
     Args:
-        engine (sqlalchemy.engine.Engine): The database engine.
+        db_engine (sqlalchemy.engine.Engine): The session-scoped engine.
 
     Yields:
-        sqlalchemy.orm.Session: A session that will be closed after the test.
+        sqlalchemy.engine.Engine: Engine connected to the test database.
     """
-    Session = sessionmaker(bind=engine)
+    engine = create_engine(db_engine.url)
+    _enable_sqlite_foreign_keys(engine)
+    _tune_sqlite_for_tests(engine)
+    yield engine
+    with engine.begin() as connection:
+        for table in reversed(Base.metadata.sorted_tables):
+            connection.execute(table.delete())
+    engine.dispose()
+
+
+@pytest.fixture
+def db_session(db_engine):
+    """Provide a database session wrapped in a SAVEPOINT rollback harness.
+
+    The session is bound to a dedicated connection holding an outer
+    transaction. With ``join_transaction_mode="create_savepoint"`` every
+    ``session.commit()`` inside a test only releases a SAVEPOINT, so the
+    outer transaction can be rolled back wholesale at teardown and the
+    schema never sees the test's writes. ``expire_on_commit=False`` keeps
+    loaded instances usable after a commit instead of re-hydrating every
+    attribute with a fresh SELECT.
+
+    Args:
+        db_engine (sqlalchemy.engine.Engine): The session-scoped engine.
+
+    Yields:
+        sqlalchemy.orm.Session: A session whose work is discarded after the test.
+    """
+    connection = db_engine.connect()
+    transaction = connection.begin()
+    Session = sessionmaker(
+        bind=connection,
+        join_transaction_mode="create_savepoint",
+        expire_on_commit=False,
+    )
     session = Session()
     try:
         yield session
     finally:
         session.close()
+        transaction.rollback()
+        connection.close()
+
+
+_db_config_cache = {}
+
 
 @pytest.fixture
 def db_config(engine):
     """Provide a DatabaseConfig instance configured for the test database.
 
+    The config (and the engine plus connection pool inside it) is cached per
+    database URL for the whole session; building it per test added an engine,
+    a pool and event-listener registration to every UnitOfWork test. The
+    function-scoped `engine` dependency is still what wipes committed rows at
+    teardown, so isolation is unchanged.
+
     Args:
         engine (sqlalchemy.engine.Engine): The database engine.
 
@@ -91,14 +223,22 @@ def db_config(engine):
         DatabaseConfig: Configuration object for database connection.
     """
     url_str = engine.url.render_as_string(hide_password=False)
-    return DatabaseConfig(url_str)
+    config = _db_config_cache.get(url_str)
+    if config is None:
+        config = DatabaseConfig(url_str)
+        _enable_sqlite_foreign_keys(config.engine)
+        _tune_sqlite_for_tests(config.engine)
+        _db_config_cache[url_str] = config
+    return config
 
 class UoWHelper:
     """Minimal unit of work with identity map, for testing repositories.
 
     This helper mimics the interface of a real UoW, providing commit, rollback,
     flush, and identity map methods. It does not track changes automatically;
-    the test must manually call commit/flush.
+    the test must manually call commit/flush. Repositories are exposed as
+    lazily-cached properties under the same names the production UnitOfWork
+    uses, so each repository is constructed at most once per helper.
 
     Attributes:
         session (sqlalchemy.orm.Session): The database session.
@@ -113,6 +253,46 @@ class UoWHelper:
         self.session = session
         self._identity_map = {}
 
+    @cached_property
+    def automations(self):
+        """AutomationRepository bound to this helper's session."""
+        return AutomationRepository(self.session, self)
+
+    @cached_property
+    def batches(self):
+        """BatchRepository bound to this helper's session."""
+        return BatchRepository(self.session, self)
+
+    @cached_property
+    def items(self):
+        """ItemRepository bound to this helper's session."""
+        return ItemRepository(self.session, self)
+
+    @cached_property
+    def runs(self):
+        """RunRepository bound to this helper's session."""
+        return RunRepository(self.session, self)
+
+    @cached_property
+    def batch_executions(self):
+        """BatchExecutionRepository bound to this helper's session."""
+        return BatchExecutionRepository(self.session, self)
+
+    @cached_property
+    def item_executions(self):
+        """ItemExecutionRepository bound to this helper's session."""
+        return ItemExecutionRepository(self.session, self)
+
+    @cached_property
+    def engines(self):
+        """EngineRepository bound to this helper's session."""
+        return EngineRepository(self.session, self)
+
+    @cached_property
+    def orchestration_instances(self):
+        """OrchestrationInstanceRepository bound to this helper's session."""
+        return OrchestrationInstanceRepository(self.session, self)
+
     def commit(self):
         """Commit the current transaction."""
         self.session.commit()
@@ -250,6 +430,242 @@ def uow_mock():
     """
     return MockUoW()
 
+
+@pytest.fixture
+def query_repo(db_session, uow_mock):
+    """Provide an AutomationRepository on the SAVEPOINT session with a mock UoW.
+
+    Tests that only exercise repository query semantics can take this single
+    fixture instead of requesting `db_session` and `uow_mock` separately and
+    constructing the repository inline.
+
+    Args:
+        db_session (Session): The SAVEPOINT-harnessed session.
+        uow_mock (MockUoW): The mock unit of work.
+
+    Returns:
+        AutomationRepository: Repository bound to the test session.
+    """
+    return AutomationRepository(db_session, uow_mock)
+
+
+@pytest.fixture(autouse=True, scope="session")
+def warm_query_cache(db_engine):
+    """Pre-compile the repositories' hot statement shapes once per session.
+
+    The suite executes the same handful of SQL shapes thousands of times
+    (get by id, the list_by_* family, the point lookups). Running each once
+    against a throwaway session pushes its compiled form into the engine's
+    query cache (sized at 1200 entries on `db_engine`) so every later call
+    pays only cache lookup + bind + execute, never compilation.
+
+    Args:
+        db_engine (sqlalchemy.engine.Engine): The session-scoped engine.
+    """
+    Session = sessionmaker(bind=db_engine)
+    session = Session()
+    uow = MockUoW()
+    probe_id = uuid4()
+
+    automation_repo = AutomationRepository(session, uow)
+    automation_repo.get(probe_id)
+    automation_repo.get_by_name("__warm__")
+    automation_repo.list_active(limit=1, offset=0)
+
+    batch_repo = BatchRepository(session, uow)
+    batch_repo.get(probe_id)
+    batch_repo.list_by_automation(probe_id, limit=1, offset=0)
+
+    item_repo = ItemRepository(session, uow)
+    item_repo.get(probe_id)
+    item_repo.list_by_batch(probe_id, limit=1, offset=0)
+
+    run_repo = RunRepository(session, uow)
+    run_repo.get(probe_id)
+    run_repo.list_by_automation(probe_id, limit=1, offset=0)
+    run_repo.list_by_status(ExecutionStatus.PENDING, limit=1, offset=0)
+    run_repo.find_running()
+
+    batch_execution_repo = BatchExecutionRepository(session, uow)
+    batch_execution_repo.get(probe_id)
+    batch_execution_repo.list_by_batch(probe_id, limit=1, offset=0)
+
+    item_execution_repo = ItemExecutionRepository(session, uow)
+    item_execution_repo.get(probe_id)
+    item_execution_repo.get_by_run_and_item(probe_id, probe_id)
+    item_execution_repo.count_by_status(probe_id, ExecutionStatus.PENDING)
+
+    engine_repo = EngineRepository(session, uow)
+    engine_repo.get(probe_id)
+    engine_repo.list_by_type("__warm__", limit=1, offset=0)
+
+    instance_repo = OrchestrationInstanceRepository(session, uow)
+    instance_repo.get(probe_id)
+    instance_repo.get_by_engine_and_external(probe_id, "__warm__")
+    instance_repo.list_by_engine(probe_id, limit=1, offset=0)
+    instance_repo.list_by_status(ExecutionStatus.PENDING, limit=1, offset=0)
+    instance_repo.list_running(limit=1, offset=0)
+
+    session.rollback()
+    session.close()
+
+
+@pytest.fixture
+def query_counter(db_engine):
+    """Count SQL statements executed on the shared engine during a test.
+
+    Guards the list_by_* tests against N+1 regressions: if building the
+    domain entities ever starts lazy-loading per row, the statement count
+    jumps from one to one-per-row and the assertion fails.
+
+    Args:
+        db_engine (sqlalchemy.engine.Engine): The session-scoped engine.
+
+    Yields:
+        object: Counter with a `count` attribute and a `reset()` method.
+    """
+    class _Counter:
+        def __init__(self):
+            self.count = 0
+
+        def reset(self):
+            self.count = 0
+
+    counter = _Counter()
+
+    def _increment(conn, cursor, statement, parameters, context, executemany):
+        counter.count += 1
+
+    event.listen(db_engine, "after_cursor_execute", _increment)
+    try:
+        yield counter
+    finally:
+        event.remove(db_engine, "after_cursor_execute", _increment)
+
+
+@pytest.fixture
+def automation_repo(test_uow):
+    """Provide an AutomationRepository bound to the test unit of work.
+
+    Args:
+        test_uow (UoWHelper): The unit of work helper.
+
+    Returns:
+        AutomationRepository: Repository bound to the test session.
+    """
+    return test_uow.automations
+
+
+@pytest.fixture
+def batch_repo(test_uow):
+    """Provide a BatchRepository bound to the test unit of work.
+
+    Args:
+        test_uow (UoWHelper): The unit of work helper.
+
+    Returns:
+        BatchRepository: Repository bound to the test session.
+    """
+    return test_uow.batches
+
+
+@pytest.fixture
+def item_repo(test_uow):
+    """Provide an ItemRepository bound to the test unit of work.
+
+    Args:
+        test_uow (UoWHelper): The unit of work helper.
+
+    Returns:
+        ItemRepository: Repository bound to the test session.
+    """
+    return test_uow.items
+
+
+@pytest.fixture
+def run_repo(test_uow):
+    """Provide a RunRepository bound to the test unit of work.
+
+    Args:
+        test_uow (UoWHelper): The unit of work helper.
+
+    Returns:
+        RunRepository: Repository bound to the test session.
+    """
+    return test_uow.runs
+
+
+@pytest.fixture
+def batch_execution_repo(test_uow):
+    """Provide a BatchExecutionRepository bound to the test unit of work.
+
+    Args:
+        test_uow (UoWHelper): The unit of work helper.
+
+    Returns:
+        BatchExecutionRepository: Repository bound to the test session.
+    """
+    return test_uow.batch_executions
+
+
+@pytest.fixture
+def item_execution_repo(test_uow):
+    """Provide an ItemExecutionRepository bound to the test unit of work.
+
+    Args:
+        test_uow (UoWHelper): The unit of work helper.
+
+    Returns:
+        ItemExecutionRepository: Repository bound to the test session.
+    """
+    return test_uow.item_executions
+
+
+@pytest.fixture
+def engine_repo(test_uow):
+    """Provide an EngineRepository bound to the test unit of work.
+
+    Args:
+        test_uow (UoWHelper): The unit of work helper.
+
+    Returns:
+        EngineRepository: Repository bound to the test session.
+    """
+    return test_uow.engines
+
+
+@pytest.fixture
+def orchestration_instance_repo(test_uow):
+    """Provide an OrchestrationInstanceRepository bound to the test unit of work.
+
+    Args:
+        test_uow (UoWHelper): The unit of work helper.
+
+    Returns:
+        OrchestrationInstanceRepository: Repository bound to the test session.
+    """
+    return test_uow.orchestration_instances
+
+
+@pytest.fixture
+def make_automation():
+    """Provide a factory for transient Automation entities.
+
+    Centralizes the `Automation(name=...)` constructions used across the
+    repository tests so construction details live in one place.
+
+    Returns:
+        Callable[..., Automation]: Factory accepting a name (default "test")
+        and extra attributes to set on the entity.
+    """
+    def _make(name="test", **attrs):
+        auto = Automation(name=name)
+        for key, value in attrs.items():
+            setattr(auto, key, value)
+        return auto
+    return _make
+
+
 @pytest.fixture
 def automation(test_uow):
     """Create and return a persisted Automation.
@@ -260,10 +676,10 @@ def automation(test_uow):
     Returns:
         Automation: A persisted automation entity.
     """
-    repo = AutomationRepository(test_uow.session, test_uow)
+    repo = test_uow.automations
     auto = Automation(name="test-auto")
     repo.create(auto)
-    test_uow.commit()
+    test_uow.session.flush()
     return auto
 
 
@@ -278,10 +694,10 @@ def batch(test_uow, automation):
     Returns:
         Batch: A persisted batch entity.
     """
-    repo = BatchRepository(test_uow.session, test_uow)
+    repo = test_uow.batches
     batch = Batch(automation_id=automation.id, name="test-batch")
     repo.create(batch)
-    test_uow.commit()
+    test_uow.session.flush()
     return batch
 
 
@@ -296,10 +712,10 @@ def item(test_uow, batch):
     Returns:
         Item: A persisted item entity.
     """
-    repo = ItemRepository(test_uow.session, test_uow)
+    repo = test_uow.items
     item = Item(batch_id=batch.id, sequence_number=1)
     repo.create(item)
-    test_uow.commit()
+    test_uow.session.flush()
     return item
 
 
@@ -314,10 +730,10 @@ def run(test_uow, automation):
     Returns:
         Run: A persisted run entity.
     """
-    repo = RunRepository(test_uow.session, test_uow)
+    repo = test_uow.runs
     run = Run(automation_id=automation.id, correlation_id="corr-123")
     repo.create(run)
-    test_uow.commit()
+    test_uow.session.flush()
     return run
 
 
@@ -333,10 +749,10 @@ def batch_execution(test_uow, run, batch):
     Returns:
         BatchExecution: A persisted batch execution entity.
     """
-    repo = BatchExecutionRepository(test_uow.session, test_uow)
+    repo = test_uow.batch_executions
     be = BatchExecution(run_id=run.id, batch_id=batch.id, status=ExecutionStatus.PENDING)
     repo.create(be)
-    test_uow.commit()
+    test_uow.session.flush()
     return be
 
 
@@ -353,7 +769,7 @@ def item_execution(test_uow, run, batch_execution, item):
     Returns:
         ItemExecution: A persisted item execution entity.
     """
-    repo = ItemExecutionRepository(test_uow.session, test_uow)
+    repo = test_uow.item_executions
     ie = ItemExecution(
         run_id=run.id,
         batch_execution_id=batch_execution.id,
@@ -362,7 +778,7 @@ def item_execution(test_uow, run, batch_execution, item):
         max_attempts=3,
     )
     repo.create(ie)
-    test_uow.commit()
+    test_uow.session.flush()
     return ie
 
 
@@ -376,10 +792,10 @@ def engine_entity(test_uow):
     Returns:
         Engine: A persisted engine entity.
     """
-    repo = EngineRepository(test_uow.session, test_uow)
+    repo = test_uow.engines
     eng = Engine(name="test-engine", type="docker")
     repo.create(eng)
-    test_uow.commit()
+    test_uow.session.flush()
     return eng
 
 
@@ -394,7 +810,7 @@ def orchestration_instance(test_uow, engine_entity):
     Returns:
         OrchestrationInstance: A persisted orchestration instance.
     """
-    repo = OrchestrationInstanceRepository(test_uow.session, test_uow)
+    repo = test_uow.orchestration_instances
     inst = OrchestrationInstance(
         engine_id=engine_entity.id,
         external_id="ext-123",
@@ -403,5 +819,119 @@ def orchestration_instance(test_uow, engine_entity):
         duration_seconds=0,
     )
     repo.create(inst)
-    test_uow.commit()
-    return inst
\ No newline at end of file
+    test_uow.session.flush()
+    return inst
+
+
+@pytest.fixture(scope="module")
+def seed_uow(db_engine):
+    """Provide a module-scoped UoWHelper for read-only seed data.
+
+    Rows created through this helper are committed for real, so every test
+    in the module can read them without rebuilding the entity hierarchy.
+    They use distinct names/identifiers from the function-scoped fixtures to
+    avoid unique-constraint collisions, and all tables are wiped at module
+    teardown.
+
+    Args:
+        db_engine (sqlalchemy.engine.Engine): The session-scoped engine.
+
+    Yields:
+        UoWHelper: The unit of work helper bound to a module-scoped session.
+    """
+    Session = sessionmaker(bind=db_engine)
+    session = Session()
+    yield UoWHelper(session)
+    session.close()
+    with db_engine.begin() as connection:
+        for table in reversed(Base.metadata.sorted_tables):
+            connection.execute(table.delete())
+
+
+@pytest.fixture(scope="module")
+def automation_seed(seed_uow):
+    """Create a committed Automation shared by all read-only tests in a module.
+
+    Args:
+        seed_uow (UoWHelper): The module-scoped unit of work helper.
+
+    Returns:
+        Automation: A persisted automation entity.
+    """
+    repo = AutomationRepository(seed_uow.session, seed_uow)
+    auto = Automation(name="seed-auto")
+    repo.create(auto)
+    seed_uow.commit()
+    return auto
+
+
+@pytest.fixture(scope="module")
+def batch_seed(seed_uow, automation_seed):
+    """Create a committed Batch belonging to the automation seed.
+
+    Args:
+        seed_uow (UoWHelper): The module-scoped unit of work helper.
+        automation_seed (Automation): The parent automation.
+
+    Returns:
+        Batch: A persisted batch entity.
+    """
+    repo = BatchRepository(seed_uow.session, seed_uow)
+    batch = Batch(automation_id=automation_seed.id, name="seed-batch")
+    repo.create(batch)
+    seed_uow.commit()
+    return batch
+
+
+@pytest.fixture(scope="module")
+def run_seed(seed_uow, automation_seed):
+    """Create a committed Run belonging to the automation seed.
+
+    Args:
+        seed_uow (UoWHelper): The module-scoped unit of work helper.
+        automation_seed (Automation): The parent automation.
+
+    Returns:
+        Run: A persisted run entity.
+    """
+    repo = RunRepository(seed_uow.session, seed_uow)
+    run = Run(automation_id=automation_seed.id, correlation_id="corr-seed")
+    repo.create(run)
+    seed_uow.commit()
+    return run
+
+
+@pytest.fixture(scope="module")
+def batch_execution_seed(seed_uow, run_seed, batch_seed):
+    """Create a committed BatchExecution for the seed run and batch.
+
+    Args:
+        seed_uow (UoWHelper): The module-scoped unit of work helper.
+        run_seed (Run): The parent run.
+        batch_seed (Batch): The parent batch.
+
+    Returns:
+        BatchExecution: A persisted batch execution entity.
+    """
+    repo = BatchExecutionRepository(seed_uow.session, seed_uow)
+    be = BatchExecution(run_id=run_seed.id, batch_id=batch_seed.id, status=ExecutionStatus.PENDING)
+    repo.create(be)
+    seed_uow.commit()
+    return be
+
+
+@pytest.fixture(scope="module")
+def engine_entity_seed(seed_uow):
+    """Create a committed Engine (orchestration) shared within a module.
+
+    Args:
+        seed_uow (UoWHelper): The module-scoped unit of work helper.
+
+    Returns:
+        Engine: A persisted engine entity.
+    """
+    repo = EngineRepository(seed_uow.session, seed_uow)
+    eng = Engine(name="seed-engine", type="docker")
+    repo.create(eng)
+    seed_uow.commit()
+    return eng
\ No newline at end of file
@@ -2,6 +2,9 @@ from uuid import uuid4
 from datetime import datetime, timezone
 
 from src.project.domain.entities.definition import Automation
+import pytest
+
+pytestmark = pytest.mark.unit
 
 
 class TestDomainEntity:
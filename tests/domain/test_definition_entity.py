@@ -5,6 +5,8 @@ import pytest
 from src.project.domain.entities.definition import Automation, Batch, Item
 from src.project.domain.exceptions import ValidationError
 
+pytestmark = pytest.mark.unit
+
 
 class TestAutomation:
     """Test suite for the Automation domain entity."""
@@ -6,6 +6,8 @@ from src.project.domain.entities import Automation, Run, ItemExecution
 from src.project.domain.enums import ExecutionStatus
 from src.project.domain.exceptions import ValidationError, InvalidStateError
 
+pytestmark = pytest.mark.unit
+
 
 class TestAutomation:
     """Test suite for the Automation entity (additional tests)."""
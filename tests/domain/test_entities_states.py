@@ -7,6 +7,8 @@ from src.project.domain.enums import ExecutionStatus
 from src.project.domain.events import DomainEvent, RunCompleted
 from src.project.domain.exceptions import InvalidStateError
 
+pytestmark = pytest.mark.unit
+
 
 class TestRunStateTransitions:
     """Test state transitions for Run entity."""
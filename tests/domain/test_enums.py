@@ -2,6 +2,8 @@ import pytest
 
 from src.project.domain.enums import ExecutionStatus
 
+pytestmark = pytest.mark.unit
+
 
 @pytest.mark.parametrize(
     "from_status,to_status,expected",
@@ -6,6 +6,8 @@ from src.project.domain.entities.execution import Run, BatchExecution, ItemExecu
 from src.project.domain.enums import ExecutionStatus
 from src.project.domain.exceptions import InvalidStateError, ValidationError
 
+pytestmark = pytest.mark.unit
+
 
 class TestRun:
     """Test suite for Run entity (comprehensive)."""
@@ -169,34 +171,24 @@ class TestItemExecution:
         assert ie.result_payload == {"output": "success"}
         assert ie.finished_at is not None
 
-    def test_fail_when_retries_remaining_transitions_to_retrying(self):
-        """Test that fail when attempts remain transitions to RETRYING."""
-        ie = ItemExecution(run_id=uuid4(), batch_execution_id=uuid4(), item_id=uuid4(), max_attempts=3)
-        ie.start()
-        ie.fail("temporary error")
-        assert ie.status == ExecutionStatus.RETRYING
-        assert ie.error_message == "temporary error"
-        assert ie.finished_at is None
-        assert ie.attempt_count == 1
-
-    def test_fail_when_no_retries_remaining_transitions_to_failed(self):
-        """Test that fail after max attempts transitions to FAILED."""
-        ie = ItemExecution(run_id=uuid4(), batch_execution_id=uuid4(), item_id=uuid4(), max_attempts=2)
-        ie.start()
-        ie.fail("first fail")
-        ie.start()
-        ie.fail("second fail")
-        assert ie.status == ExecutionStatus.FAILED
-        assert ie.error_message == "second fail"
-        assert ie.finished_at is not None
-
-    def test_fail_when_max_attempts_none_transitions_to_failed(self):
-        """Test that fail when max_attempts is None transitions directly to FAILED."""
-        ie = ItemExecution(run_id=uuid4(), batch_execution_id=uuid4(), item_id=uuid4())
-        ie.start()
-        ie.fail("error")
-        assert ie.status == ExecutionStatus.FAILED
-        assert ie.finished_at is not None
+    @pytest.mark.parametrize("max_attempts,fail_count,expected_status", [
+        (3, 1, ExecutionStatus.RETRYING),
+        (2, 2, ExecutionStatus.FAILED),
+        (None, 1, ExecutionStatus.FAILED),
+    ])
+    def test_fail_transitions(self, max_attempts, fail_count, expected_status):
+        """Test fail transitions to RETRYING while attempts remain, else FAILED."""
+        ie = ItemExecution(run_id=uuid4(), batch_execution_id=uuid4(), item_id=uuid4(), max_attempts=max_attempts)
+        for i in range(fail_count):
+            ie.start()
+            ie.fail(f"fail {i + 1}")
+        assert ie.status == expected_status
+        assert ie.error_message == f"fail {fail_count}"
+        assert ie.attempt_count == fail_count
+        if expected_status == ExecutionStatus.RETRYING:
+            assert ie.finished_at is None
+        else:
+            assert ie.finished_at is not None
 
     def test_can_retry_true_when_attempts_remaining(self):
         """Test can_retry returns True when attempts left."""
@@ -6,6 +6,8 @@ from src.project.domain.entities.orchestration import Engine, OrchestrationInsta
 from src.project.domain.enums import ExecutionStatus
 from src.project.domain.exceptions import InvalidStateError, ValidationError
 
+pytestmark = pytest.mark.unit
+
 
 class TestEngine:
     """Test suite for Engine entity."""
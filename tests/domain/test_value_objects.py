@@ -1,3 +1,4 @@
+from dataclasses import FrozenInstanceError
 from datetime import datetime
 
 import pytest
@@ -5,6 +6,8 @@ import pytest
 from src.project.domain.value_objects import Schema, AuditInfo, VersionInfo
 from src.project.domain.exceptions import ValidationError
 
+pytestmark = pytest.mark.unit
+
 
 class TestSchema:
     """Test suite for Schema value object."""
@@ -38,7 +41,7 @@ class TestAuditInfo:
     def test_audit_info_immutable(self):
         """Test that AuditInfo attributes cannot be changed (immutable)."""
         audit = AuditInfo(created_at=datetime.now(), created_by="admin")
-        with pytest.raises(Exception):
+        with pytest.raises(FrozenInstanceError):
             audit.created_by = "other"
 
 
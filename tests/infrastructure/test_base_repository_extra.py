@@ -1,10 +1,10 @@
 from uuid import uuid4
 
 import pytest
-from sqlalchemy import text
+from sqlalchemy import update
 from sqlalchemy.orm import Session
 
-from src.project.domain.entities.definition import Automation
+from src.project.infrastructure.database.models.definition.automation import AutomationModel
 from src.project.infrastructure.database.repositories.definition import AutomationRepository
 from src.project.infrastructure.exceptions.repository import (
     DuplicateEntityError,
@@ -14,10 +14,13 @@ from src.project.infrastructure.exceptions.repository import (
 )
 from tests.conftest import UoWHelper
 
+pytestmark = pytest.mark.db
+
 
 class TestBaseRepositoryConcurrency:
     """Test concurrency handling in BaseRepository."""
-    def test_concurrent_update_raises_concurrency_error(self, engine):
+    @pytest.mark.slow
+    def test_concurrent_update_raises_concurrency_error(self, engine, make_automation):
         """Test that concurrent updates with versioning enabled raise ConcurrencyError."""
         original_versioning = AutomationRepository.use_versioning
         AutomationRepository.use_versioning = True
@@ -25,7 +28,7 @@ class TestBaseRepositoryConcurrency:
             session1 = Session(bind=engine)
             uow1 = UoWHelper(session1)
             repo1 = AutomationRepository(session1, uow1)
-            auto = Automation(name="concurrent-test")
+            auto = make_automation("concurrent-test")
             created = repo1.create(auto)
             uow1.commit()
 
@@ -48,10 +51,10 @@ class TestBaseRepositoryConcurrency:
         finally:
             AutomationRepository.use_versioning = original_versioning
 
-    def test_soft_delete_with_expected_version_success(self, test_uow):
+    def test_soft_delete_with_expected_version_success(self, test_uow, make_automation, automation_repo):
         """Test soft-delete succeeds when expected_version matches current version."""
-        repo = AutomationRepository(test_uow.session, test_uow)
-        auto = Automation(name="test")
+        repo = automation_repo
+        auto = make_automation()
         created = repo.create(auto)
         test_uow.commit()
 
@@ -65,79 +68,113 @@ class TestBaseRepositoryConcurrency:
 
 class TestBaseRepositoryErrorHandling:
     """Test error handling methods of BaseRepository."""
-    def test_get_or_raise_raises_not_found(self, test_uow):
+    def test_get_or_raise_raises_not_found(self, test_uow, automation_repo):
         """Test get_or_raise raises EntityNotFoundError for missing entity."""
-        repo = AutomationRepository(test_uow.session, test_uow)
+        repo = automation_repo
         with pytest.raises(EntityNotFoundError):
             repo.get_or_raise(uuid4())
 
-    def test_list_with_invalid_filter_raises_repository_error(self, test_uow):
+    def test_list_with_invalid_filter_raises_repository_error(self, test_uow, automation_repo):
         """Test that passing an invalid filter field raises RepositoryError."""
-        repo = AutomationRepository(test_uow.session, test_uow)
+        repo = automation_repo
         with pytest.raises(RepositoryError, match="Invalid filter field"):
             repo.list(invalid_field="value")
 
-    def test_create_duplicate_raises_duplicate_entity_error(self, test_uow):
+    def test_create_duplicate_raises_duplicate_entity_error(self, test_uow, make_automation, automation_repo):
         """Test that creating a duplicate raises DuplicateEntityError."""
-        repo = AutomationRepository(test_uow.session, test_uow)
-        auto1 = Automation(name="dup")
+        repo = automation_repo
+        auto1 = make_automation("dup")
         repo.create(auto1)
         test_uow.commit()
 
-        auto2 = Automation(name="dup")
+        auto2 = make_automation("dup")
         with pytest.raises(DuplicateEntityError):
-            repo.create(auto2)
-        test_uow.rollback()
+            with test_uow.session.begin_nested():
+                repo.create(auto2)
 
-    def test_refresh_untracked_entity_raises(self, test_uow):
+    def test_refresh_untracked_entity_raises(self, test_uow, make_automation, automation_repo):
         """Test refreshing an entity not tracked raises RepositoryError."""
-        repo = AutomationRepository(test_uow.session, test_uow)
-        auto = Automation(name="test")
-        auto.id = uuid4()
+        repo = automation_repo
+        auto = make_automation()
         with pytest.raises(RepositoryError, match="Cannot refresh untracked"):
             repo.refresh(auto)
 
-    def test_refresh_tracked_entity_updates(self, test_uow):
+    def test_refresh_tracked_entity_updates(self, test_uow, make_automation, automation_repo):
         """Test refreshing a tracked entity updates its state from the database."""
-        repo = AutomationRepository(test_uow.session, test_uow)
-        auto = Automation(name="original")
+        repo = automation_repo
+        auto = make_automation("original")
         created = repo.create(auto)
         test_uow.commit()
 
         test_uow.session.execute(
-            text("UPDATE automation SET name='changed' WHERE id = :id"), {"id": created.id}
+            update(AutomationModel)
+            .where(AutomationModel.id == created.id)
+            .values(name="changed")
         )
         test_uow.session.commit()
 
         refreshed = repo.refresh(created)
         assert refreshed.name == "changed"
 
-    def test_exists(self, test_uow):
+    def test_exists(self, test_uow, make_automation, automation_repo):
         """Test exists returns True for existing entity, False otherwise."""
-        repo = AutomationRepository(test_uow.session, test_uow)
-        auto = Automation(name="test")
+        repo = automation_repo
+        auto = make_automation()
         created = repo.create(auto)
         test_uow.commit()
         assert repo.exists(created.id) is True
         assert repo.exists(uuid4()) is False
 
-    def test_count(self, test_uow):
+    def test_peek_returns_model_without_soft_delete_filter(self, test_uow, make_automation, automation_repo, query_counter):
+        """Test peek returns the ORM model from the identity map, soft-deleted included."""
+        repo = automation_repo
+        created = repo.create(make_automation("peeked"))
+        test_uow.commit()
+
+        model = repo.peek(created.id)
+        assert model is not None
+        assert model.name == "peeked"
+
+        query_counter.reset()
+        assert repo.peek(created.id) is model
+        assert query_counter.count == 0
+
+        repo.delete(created.id, soft=True)
+        test_uow.commit()
+        assert repo.get(created.id) is None
+        assert repo.peek(created.id) is not None
+
+    def test_soft_delete_by_ids(self, test_uow, make_automation, automation_repo):
+        """Test set-based soft delete updates rows and tracked entities in one statement."""
+        repo = automation_repo
+        created = [repo.create(make_automation(f"bulk-sd-{i}")) for i in range(3)]
+        test_uow.commit()
+
+        assert repo.soft_delete_by_ids([]) == 0
+        assert repo.soft_delete_by_ids([created[0].id, created[1].id]) == 2
+        test_uow.commit()
+
+        assert created[0].is_active is False
+        assert created[1].is_active is False
+        assert repo.get(created[0].id) is None
+        assert repo.get(created[1].id) is None
+        assert repo.get(created[2].id) is not None
+
+    def test_count(self, test_uow, make_automation, automation_repo):
         """Test count returns the correct number of entities, respecting soft-delete."""
-        repo = AutomationRepository(test_uow.session, test_uow)
-        for i in range(3):
-            auto = Automation(name=f"auto{i}")
-            repo.create(auto)
+        repo = automation_repo
+        ids = [repo.create(make_automation(f"auto{i}")).id for i in range(3)]
         test_uow.commit()
         assert repo.count() == 3
         assert repo.count(include_soft_deleted=True) == 3
 
-        autos = repo.list()
-        repo.delete(autos[0].id, soft=True)
+        repo.delete(ids[0], soft=True)
         test_uow.commit()
         assert repo.count() == 2
         assert repo.count(include_soft_deleted=True) == 3
 
-    def test_soft_delete_with_stale_version_raises_concurrency(self, engine):
+    @pytest.mark.slow
+    def test_soft_delete_with_stale_version_raises_concurrency(self, engine, make_automation):
         """Test that soft-delete with stale version raises ConcurrencyError."""
         original_versioning = AutomationRepository.use_versioning
         AutomationRepository.use_versioning = True
@@ -145,7 +182,7 @@ class TestBaseRepositoryErrorHandling:
             session1 = Session(bind=engine)
             uow1 = UoWHelper(session1)
             repo1 = AutomationRepository(session1, uow1)
-            auto = Automation(name="test")
+            auto = make_automation()
             created = repo1.create(auto)
             uow1.commit()
             assert created.version == 1
@@ -166,7 +203,8 @@ class TestBaseRepositoryErrorHandling:
         finally:
             AutomationRepository.use_versioning = original_versioning
 
-    def test_hard_delete_with_stale_version_raises_concurrency(self, engine):
+    @pytest.mark.slow
+    def test_hard_delete_with_stale_version_raises_concurrency(self, engine, make_automation):
         """Test that hard-delete with stale version raises ConcurrencyError."""
         original_versioning = AutomationRepository.use_versioning
         AutomationRepository.use_versioning = True
@@ -174,7 +212,7 @@ class TestBaseRepositoryErrorHandling:
             session1 = Session(bind=engine)
             uow1 = UoWHelper(session1)
             repo1 = AutomationRepository(session1, uow1)
-            auto = Automation(name="test")
+            auto = make_automation()
             created = repo1.create(auto)
             uow1.commit()
             assert created.version == 1
@@ -195,7 +233,7 @@ class TestBaseRepositoryErrorHandling:
         finally:
             AutomationRepository.use_versioning = original_versioning
 
-    def test_update_with_expected_version_none_and_versioning_enabled(self, engine):
+    def test_update_with_expected_version_none_and_versioning_enabled(self, engine, make_automation):
         """Test update without expected_version uses internal version when versioning enabled."""
         original_versioning = AutomationRepository.use_versioning
         AutomationRepository.use_versioning = True
@@ -203,7 +241,7 @@ class TestBaseRepositoryErrorHandling:
             session1 = Session(bind=engine)
             uow1 = UoWHelper(session1)
             repo1 = AutomationRepository(session1, uow1)
-            auto = Automation(name="test")
+            auto = make_automation()
             created = repo1.create(auto)
             uow1.commit()
 
@@ -1,22 +1,34 @@
 import time
-from uuid import uuid4
 
 from sqlalchemy.orm import Session
 
 from src.project.infrastructure.database.models.definition.automation import AutomationModel
+from tests.conftest import make_uuids
+import pytest
 
+pytestmark = pytest.mark.db
 
-def test_timestamp_mixin(db_session, engine):
-    """Test that TimestampMixin automatically updates updated_at on modification."""
-    model = AutomationModel(id=uuid4(), name="test", version=1)
-    db_session.add(model)
-    db_session.commit()
-    original_updated = model.updated_at
+_MODEL_IDS = make_uuids(3)
+
+
+def test_timestamp_mixin(engine):
+    """Test that TimestampMixin automatically updates updated_at on modification.
+
+    Uses its own engine-bound sessions rather than the SAVEPOINT-wrapped
+    db_session: both writes must land in separate transactions so the
+    server-side now() timestamps differ.
+    """
+    model_id = _MODEL_IDS[0]
+    with Session(engine) as setup_session:
+        model = AutomationModel(id=model_id, name="test", version=1)
+        setup_session.add(model)
+        setup_session.commit()
+        original_updated = model.updated_at
 
     time.sleep(1)
 
     with Session(engine) as new_session:
-        model2 = new_session.get(AutomationModel, model.id)
+        model2 = new_session.get(AutomationModel, model_id)
         model2.name = "new"
         new_session.commit()
         new_session.refresh(model2)
@@ -27,7 +39,7 @@ def test_timestamp_mixin(db_session, engine):
 def test_audit_mixin(db_session):
     """Test that AuditMixin stores created_by and updated_by correctly."""
     model = AutomationModel(
-        id=uuid4(),
+        id=_MODEL_IDS[1],
         name="audit",
         version=1,
         created_by="tester",
@@ -41,7 +53,7 @@ def test_audit_mixin(db_session):
 
 def test_version_mixin(db_session):
     """Test that VersionMixin handles version increments."""
-    model = AutomationModel(id=uuid4(), name="version", version=1)
+    model = AutomationModel(id=_MODEL_IDS[2], name="version", version=1)
     db_session.add(model)
     db_session.flush()
     assert model.version == 1
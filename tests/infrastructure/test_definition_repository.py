@@ -1,24 +1,25 @@
 import pytest
 
 from src.project.domain.entities.definition import Automation
-from src.project.infrastructure.database.repositories.definition import AutomationRepository
 from src.project.infrastructure.exceptions.repository import DuplicateEntityError
 
+pytestmark = pytest.mark.db
+
 
 class TestAutomationRepository:
-    def test_create_automation(self, test_uow):
-        repo = AutomationRepository(test_uow.session, test_uow)
+    def test_create_automation(self, test_uow, automation_repo):
+        repo = automation_repo
         automation = Automation(name="test-auto")
         created = repo.create(automation)
         test_uow.commit()
 
-        found = repo.get(created.id)
+        found = repo.peek(created.id)
         assert found is not None
         assert found.name == "test-auto"
         assert found.id is not None
 
-    def test_get_by_name(self, test_uow):
-        repo = AutomationRepository(test_uow.session, test_uow)
+    def test_get_by_name(self, test_uow, automation_repo):
+        repo = automation_repo
         automation = Automation(name="unique-name")
         created = repo.create(automation)
         test_uow.commit()
@@ -27,12 +28,59 @@ class TestAutomationRepository:
         assert found is not None
         assert found.id == created.id
 
-    def test_get_by_name_not_found(self, test_uow):
-        repo = AutomationRepository(test_uow.session, test_uow)
+    def test_get_by_name_not_found(self, test_uow, automation_repo):
+        repo = automation_repo
         assert repo.get_by_name("non-existent") is None
 
-    def test_update_automation(self, test_uow):
-        repo = AutomationRepository(test_uow.session, test_uow)
+    def test_get_after_commit_hits_identity_map(self, test_uow, automation_repo, query_counter):
+        repo = automation_repo
+        created = repo.create(Automation(name="identity-hit"))
+        test_uow.commit()
+
+        query_counter.reset()
+        found = repo.get(created.id)
+        assert found is created
+        assert query_counter.count == 0
+
+    def test_get_by_name_cached_within_transaction(self, test_uow, automation_repo, query_counter):
+        repo = automation_repo
+        automation = Automation(name="cached-name")
+        repo.create(automation)
+        test_uow.commit()
+
+        first = repo.get_by_name("cached-name")
+        query_counter.reset()
+        second = repo.get_by_name("cached-name")
+        assert second is first
+        assert query_counter.count == 0
+
+    def test_get_by_name_cache_invalidated_on_create(self, test_uow, automation_repo):
+        repo = automation_repo
+        assert repo.get_by_name("late-arrival") is None
+
+        automation = Automation(name="late-arrival")
+        repo.create(automation)
+        test_uow.commit()
+        assert repo.get_by_name("late-arrival") is not None
+
+    def test_get_by_name_cache_invalidated_on_bulk_create(self, test_uow, automation_repo):
+        repo = automation_repo
+        assert repo.get_by_name("bulk-arrival") is None
+
+        repo.bulk_create([Automation(name="bulk-arrival")])
+        assert repo.get_by_name("bulk-arrival") is not None
+
+    def test_get_by_name_cache_invalidated_on_soft_delete_by_ids(self, test_uow, automation_repo):
+        repo = automation_repo
+        created = repo.create(Automation(name="bulk-gone"))
+        test_uow.commit()
+
+        assert repo.get_by_name("bulk-gone") is not None
+        repo.soft_delete_by_ids([created.id])
+        assert repo.get_by_name("bulk-gone") is None
+
+    def test_update_automation(self, test_uow, automation_repo):
+        repo = automation_repo
         automation = Automation(name="old")
         created = repo.create(automation)
         test_uow.commit()
@@ -42,12 +90,12 @@ class TestAutomationRepository:
         repo.update(created.id, created)
         test_uow.commit()
 
-        updated = repo.get(created.id)
+        updated = repo.peek(created.id)
         assert updated.name == "new"
         assert updated.version == original_version + 1
 
-    def test_delete_automation(self, test_uow):
-        repo = AutomationRepository(test_uow.session, test_uow)
+    def test_delete_automation(self, test_uow, automation_repo):
+        repo = automation_repo
         automation = Automation(name="to-delete")
         created = repo.create(automation)
         test_uow.commit()
@@ -57,13 +105,17 @@ class TestAutomationRepository:
 
         assert repo.get(created.id) is None
 
-    def test_duplicate_name_raises_duplicate_error(self, test_uow):
-        repo = AutomationRepository(test_uow.session, test_uow)
+    def test_duplicate_name_raises_duplicate_error(self, test_uow, automation_repo):
+        repo = automation_repo
         a1 = Automation(name="dup")
         repo.create(a1)
         test_uow.commit()
 
         a2 = Automation(name="dup")
         with pytest.raises(DuplicateEntityError):
-            repo.create(a2)
-        test_uow.rollback()
\ No newline at end of file
+            with test_uow.session.begin_nested():
+                repo.create(a2)
+
+        found = repo.get_by_name("dup")
+        assert found is not None
+        assert found.id == a1.id
\ No newline at end of file
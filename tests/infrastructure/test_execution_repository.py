@@ -1,37 +1,37 @@
 import pytest
 
-from src.project.domain.entities.definition import Automation, Batch
-from src.project.domain.entities.execution import Run, BatchExecution
 from src.project.domain.enums import ExecutionStatus
-from src.project.infrastructure.database.repositories.definition import AutomationRepository, BatchRepository
-from src.project.infrastructure.database.repositories.execution import RunRepository, BatchExecutionRepository
+
+pytestmark = pytest.mark.db
 
 
 class TestRunRepository:
-    def test_get_by_correlation_id(self, test_uow, run):
-        repo = RunRepository(test_uow.session, test_uow)
-        found = repo.get_by_correlation_id(run.correlation_id)
+    def test_get_by_correlation_id(self, test_uow, run_seed, run_repo):
+        repo = run_repo
+        found = repo.get_by_correlation_id(run_seed.correlation_id)
         assert found is not None
-        assert found.id == run.id
+        assert found.id == run_seed.id
 
-    def test_get_by_correlation_id_not_found(self, test_uow):
-        repo = RunRepository(test_uow.session, test_uow)
+    def test_get_by_correlation_id_not_found(self, test_uow, run_repo):
+        repo = run_repo
         assert repo.get_by_correlation_id("missing") is None
 
-    def test_list_by_status(self, test_uow, run):
-        repo = RunRepository(test_uow.session, test_uow)
+    def test_list_by_status(self, test_uow, run_seed, run_repo):
+        repo = run_repo
         runs = repo.list_by_status(ExecutionStatus.PENDING)
         assert len(runs) >= 1
-        assert any(r.id == run.id for r in runs)
+        assert any(r.id == run_seed.id for r in runs)
 
-    def test_list_by_automation(self, test_uow, run, automation):
-        repo = RunRepository(test_uow.session, test_uow)
-        runs = repo.list_by_automation(automation.id)
+    def test_list_by_automation(self, test_uow, run_seed, automation_seed, run_repo, query_counter):
+        repo = run_repo
+        query_counter.reset()
+        runs = repo.list_by_automation(automation_seed.id)
         assert len(runs) == 1
-        assert runs[0].id == run.id
+        assert runs[0].id == run_seed.id
+        assert query_counter.count <= 2
 
-    def test_update_run_status(self, test_uow, run):
-        repo = RunRepository(test_uow.session, test_uow)
+    def test_update_run_status(self, test_uow, run, run_repo):
+        repo = run_repo
         run = repo.get(run.id)
         original_version = run.version
         run.status = ExecutionStatus.COMPLETED
@@ -42,28 +42,30 @@ class TestRunRepository:
         assert updated.status == ExecutionStatus.COMPLETED
         assert updated.version == original_version + 1
 
-    def test_delete_run(self, test_uow, run):
-        repo = RunRepository(test_uow.session, test_uow)
+    def test_delete_run(self, test_uow, run, run_repo):
+        repo = run_repo
         repo.delete(run.id)
         test_uow.commit()
         assert repo.get(run.id) is None
 
 
 class TestBatchExecutionRepository:
-    def test_get_by_run_and_batch(self, test_uow, batch_execution, run, batch):
-        repo = BatchExecutionRepository(test_uow.session, test_uow)
-        found = repo.get_by_run_and_batch(run.id, batch.id)
+    def test_get_by_run_and_batch(self, test_uow, batch_execution_seed, run_seed, batch_seed, batch_execution_repo):
+        repo = batch_execution_repo
+        found = repo.get_by_run_and_batch(run_seed.id, batch_seed.id)
         assert found is not None
-        assert found.id == batch_execution.id
+        assert found.id == batch_execution_seed.id
 
-    def test_list_by_run(self, test_uow, batch_execution, run):
-        repo = BatchExecutionRepository(test_uow.session, test_uow)
-        results = repo.list_by_run(run.id)
+    def test_list_by_run(self, test_uow, batch_execution_seed, run_seed, batch_execution_repo, query_counter):
+        repo = batch_execution_repo
+        query_counter.reset()
+        results = repo.list_by_run(run_seed.id)
         assert len(results) == 1
-        assert results[0].id == batch_execution.id
+        assert results[0].id == batch_execution_seed.id
+        assert query_counter.count <= 2
 
-    def test_update_batch_execution_status(self, test_uow, batch_execution):
-        repo = BatchExecutionRepository(test_uow.session, test_uow)
+    def test_update_batch_execution_status(self, test_uow, batch_execution, batch_execution_repo):
+        repo = batch_execution_repo
         be = repo.get(batch_execution.id)
         original_version = be.version
         be.status = ExecutionStatus.COMPLETED
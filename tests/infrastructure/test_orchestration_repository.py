@@ -1,13 +1,15 @@
 from src.project.domain.entities.orchestration import Engine, OrchestrationInstance
 from src.project.domain.enums import ExecutionStatus
-from src.project.infrastructure.database.repositories.orchestration import EngineRepository, OrchestrationInstanceRepository
+import pytest
+
+pytestmark = pytest.mark.db
 
 
 class TestEngineRepository:
     """Test suite for EngineRepository."""
-    def test_create_engine(self, test_uow):
+    def test_create_engine(self, test_uow, engine_repo):
         """Test creating and retrieving an engine."""
-        repo = EngineRepository(test_uow.session, test_uow)
+        repo = engine_repo
         engine = Engine(name="test-engine", type="docker")
         created = repo.create(engine)
         test_uow.commit()
@@ -16,9 +18,9 @@ class TestEngineRepository:
         assert found is not None
         assert found.name == "test-engine"
 
-    def test_get_by_name(self, test_uow):
+    def test_get_by_name(self, test_uow, engine_repo):
         """Test retrieving an engine by name."""
-        repo = EngineRepository(test_uow.session, test_uow)
+        repo = engine_repo
         engine = Engine(name="unique-engine", type="k8s")
         created = repo.create(engine)
         test_uow.commit()
@@ -27,17 +29,28 @@ class TestEngineRepository:
         assert found is not None
         assert found.id == created.id
 
-    def test_get_by_name_not_found(self, test_uow):
+    def test_get_by_name_not_found(self, test_uow, engine_repo):
         """Test that a missing name returns None."""
-        repo = EngineRepository(test_uow.session, test_uow)
+        repo = engine_repo
         assert repo.get_by_name("missing") is None
 
+    def test_get_after_commit_hits_identity_map(self, test_uow, engine_repo, query_counter):
+        """Test that get after create+commit is served without a SELECT."""
+        repo = engine_repo
+        created = repo.create(Engine(name="identity-engine", type="docker"))
+        test_uow.commit()
+
+        query_counter.reset()
+        found = repo.get(created.id)
+        assert found is created
+        assert query_counter.count == 0
+
 
 class TestOrchestrationInstanceRepository:
     """Test suite for OrchestrationInstanceRepository."""
-    def test_create_instance(self, test_uow, engine_entity):
+    def test_create_instance(self, test_uow, engine_entity, orchestration_instance_repo):
         """Test creating and retrieving an orchestration instance."""
-        repo = OrchestrationInstanceRepository(test_uow.session, test_uow)
+        repo = orchestration_instance_repo
         instance = OrchestrationInstance(
             engine_id=engine_entity.id,
             external_id="ext-123",
@@ -52,11 +65,11 @@ class TestOrchestrationInstanceRepository:
         assert found is not None
         assert found.external_id == "ext-123"
 
-    def test_get_by_engine_and_external(self, test_uow, engine_entity):
+    def test_get_by_engine_and_external(self, test_uow, engine_entity_seed, orchestration_instance_repo):
         """Test retrieving an instance by engine_id and external_id."""
-        repo = OrchestrationInstanceRepository(test_uow.session, test_uow)
+        repo = orchestration_instance_repo
         instance = OrchestrationInstance(
-            engine_id=engine_entity.id,
+            engine_id=engine_entity_seed.id,
             external_id="ext-456",
             status=ExecutionStatus.PENDING,
             instance_metadata={},
@@ -65,6 +78,6 @@ class TestOrchestrationInstanceRepository:
         created = repo.create(instance)
         test_uow.commit()
 
-        found = repo.get_by_engine_and_external(engine_entity.id, "ext-456")
+        found = repo.get_by_engine_and_external(engine_entity_seed.id, "ext-456")
         assert found is not None
         assert found.id == created.id
\ No newline at end of file
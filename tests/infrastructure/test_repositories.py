@@ -1,9 +1,16 @@
+from datetime import datetime, timezone
+
 import pytest
+from sqlalchemy import insert
 
+from src.project.infrastructure.database.models.execution import RunModel
 from src.project.infrastructure.database.repositories.definition import AutomationRepository
 from src.project.infrastructure.database.repositories.execution import RunRepository
-from src.project.domain.entities import Automation, Run
+from src.project.domain.entities import Automation
 from src.project.domain.enums import ExecutionStatus
+from tests.conftest import make_uuids
+
+pytestmark = pytest.mark.db
 
 
 class TestAutomationRepository:
@@ -55,27 +62,33 @@ class TestAutomationRepository:
 
 class TestRunRepository:
     def test_find_running(self, db_session, uow_mock, automation):
+        """Seed the three runs with one executemany INSERT.
+
+        The started/completed states are precomputed as rows instead of
+        constructing Run entities and calling start(), so setup is a single
+        statement.
+        """
         auto_repo = AutomationRepository(db_session, uow_mock)
         auto1 = automation
         auto2 = Automation(name="test-auto-2")
         auto2 = auto_repo.create(auto2)
 
         repo = RunRepository(db_session, uow_mock)
-        run1 = Run(automation_id=auto1.id)
-        run1.start()
-        run2 = Run(automation_id=auto1.id)
-        run2.status = ExecutionStatus.COMPLETED
-        run3 = Run(automation_id=auto2.id)
-        run3.start()
-
-        repo.create(run1)
-        repo.create(run2)
-        repo.create(run3)
+        now = datetime.now(timezone.utc)
+        processing_a, completed_a, processing_b = make_uuids(3)
+        db_session.execute(insert(RunModel), [
+            {"id": processing_a, "automation_id": auto1.id,
+             "status": ExecutionStatus.PROCESSING, "started_at": now},
+            {"id": completed_a, "automation_id": auto1.id,
+             "status": ExecutionStatus.COMPLETED, "started_at": None},
+            {"id": processing_b, "automation_id": auto2.id,
+             "status": ExecutionStatus.PROCESSING, "started_at": now},
+        ])
 
         running = repo.find_running()
         assert len(running) == 2
-        assert {r.id for r in running} == {run1.id, run3.id}
+        assert {r.id for r in running} == {processing_a, processing_b}
 
         running_for_auto = repo.find_running(automation_id=auto1.id)
         assert len(running_for_auto) == 1
-        assert running_for_auto[0].id == run1.id
\ No newline at end of file
+        assert running_for_auto[0].id == processing_a
\ No newline at end of file
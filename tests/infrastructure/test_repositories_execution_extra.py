@@ -1,61 +1,71 @@
 import pytest
 from uuid import uuid4
 
-from src.project.domain.entities.definition import Automation, Batch, Item
+from sqlalchemy import insert
+
+from src.project.domain.entities.definition import Automation, Item
 from src.project.domain.entities.execution import Run, BatchExecution, ItemExecution
 from src.project.domain.enums import ExecutionStatus
-from src.project.infrastructure.database.repositories.definition import (
-    AutomationRepository,
-    BatchRepository,
-    ItemRepository,
-)
-from src.project.infrastructure.database.repositories.execution import (
-    RunRepository,
-    BatchExecutionRepository,
-    ItemExecutionRepository,
-)
+from src.project.infrastructure.database.models.definition.item import ItemModel
+from src.project.infrastructure.database.models.execution.run import RunModel
+from tests.conftest import make_uuids
+pytestmark = pytest.mark.db
 
 
 class TestRunRepositoryFilters:
     """Test filter methods of RunRepository."""
     @pytest.fixture
     def setup_runs(self, test_uow, automation):
-        """Create multiple runs for testing."""
-        repo = RunRepository(test_uow.session, test_uow)
-        runs = []
-        for i in range(5):
-            run = Run(automation_id=automation.id, status=ExecutionStatus.PENDING)
-            run = repo.create(run)
-            runs.append(run)
-        test_uow.commit()
-        return runs
+        """Seed five PENDING runs with one Core INSERT, skipping ORM bookkeeping."""
+        ids = make_uuids(5)
+        test_uow.session.execute(
+            insert(RunModel),
+            [{"id": run_id, "automation_id": automation.id, "status": ExecutionStatus.PENDING} for run_id in ids],
+        )
+        test_uow.session.flush()
+        return ids
 
     @pytest.mark.parametrize("status,expected", [(ExecutionStatus.PENDING, 5), (ExecutionStatus.COMPLETED, 0), (None, 5)])
-    def test_list_by_automation_status_filter(self, test_uow, automation, setup_runs, status, expected):
+    def test_list_by_automation_status_filter(self, test_uow, automation, setup_runs, status, expected, run_repo):
         """Test filtering list_by_automation by status."""
-        repo = RunRepository(test_uow.session, test_uow)
+        repo = run_repo
         runs = repo.list_by_automation(automation.id, status=status)
         assert len(runs) == expected
 
-    @pytest.mark.parametrize("limit,offset,expected", [(0, 0, 0), (2, 0, 2), (2, 2, 2), (2, 10, 0)])
-    def test_list_by_automation_pagination(self, test_uow, automation, limit, offset, expected):
-        """Test pagination of list_by_automation."""
-        repo = RunRepository(test_uow.session, test_uow)
-        for i in range(5):
-            run = Run(automation_id=automation.id, status=ExecutionStatus.PENDING)
-            repo.create(run)
-        test_uow.commit()
-        result = repo.list_by_automation(automation.id, limit=limit, offset=offset)
-        assert len(result) == expected
+    def test_list_by_automation_pagination(self, test_uow, automation, setup_runs, run_repo):
+        """Test pagination of list_by_automation across limit/offset combinations."""
+        repo = run_repo
+        for limit, offset, expected in [(0, 0, 0), (2, 0, 2), (2, 2, 2), (2, 10, 0)]:
+            result = repo.list_by_automation(automation.id, limit=limit, offset=offset)
+            assert len(result) == expected
+
+    def test_list_by_automation_keyset(self, test_uow, automation, run_repo):
+        """Test keyset pagination pages through the same rows as a full list."""
+        repo = run_repo
+        repo.bulk_create(
+            [Run(automation_id=automation.id, status=ExecutionStatus.PENDING) for _ in range(5)]
+        )
+        test_uow.session.flush()
 
-    def test_list_by_status_with_soft_deleted(self, test_uow, automation):
+        full = repo.list_by_automation(automation.id)
+        page1 = repo.list_by_automation(automation.id, limit=2)
+        page2 = repo.list_by_automation(automation.id, limit=2, after=page1[-1].id)
+        page3 = repo.list_by_automation(automation.id, limit=2, after=page2[-1].id)
+        assert [r.id for r in page1 + page2 + page3] == [r.id for r in full]
+        assert repo.list_by_automation(automation.id, limit=2, after=page3[-1].id) == []
+
+    def test_list_by_automation_keyset_unknown_cursor(self, test_uow, automation, run_repo):
+        """Test that an unknown keyset cursor raises a repository error."""
+        with pytest.raises(Exception, match="Unknown pagination cursor"):
+            run_repo.list_by_automation(automation.id, after=uuid4())
+
+    def test_list_by_status_with_soft_deleted(self, test_uow, automation, run_repo):
         """Test list_by_status with include_soft_deleted."""
-        repo = RunRepository(test_uow.session, test_uow)
+        repo = run_repo
         run = Run(automation_id=automation.id, status=ExecutionStatus.PENDING)
         run = repo.create(run)
-        test_uow.commit()
         repo.delete(run.id, soft=True)
-        test_uow.commit()
+        test_uow.session.flush()
 
         assert len(repo.list_by_status(ExecutionStatus.PENDING)) == 0
         assert len(repo.list_by_status(ExecutionStatus.PENDING, include_soft_deleted=True)) == 1
@@ -64,23 +74,21 @@ class TestRunRepositoryFilters:
 class TestRunRepositoryExtra:
     """Additional tests for RunRepository."""
     @pytest.mark.parametrize("include_soft_deleted,expected", [(False, 2), (True, 3)])
-    def test_list_by_automation_include_soft_deleted(self, test_uow, automation, include_soft_deleted, expected):
+    def test_list_by_automation_include_soft_deleted(self, test_uow, automation, include_soft_deleted, expected, run_repo):
         """Test include_soft_deleted for list_by_automation."""
-        repo = RunRepository(test_uow.session, test_uow)
-        for i in range(3):
-            run = Run(automation_id=automation.id, status=ExecutionStatus.PENDING)
-            repo.create(run)
-        test_uow.commit()
-        runs = repo.list()
-        repo.delete(runs[0].id, soft=True)
-        test_uow.commit()
+        repo = run_repo
+        created = repo.bulk_create(
+            [Run(automation_id=automation.id, status=ExecutionStatus.PENDING) for _ in range(3)]
+        )
+        repo.soft_delete_by_ids([created[0].id])
+        test_uow.session.flush()
         result = repo.list_by_automation(automation.id, include_soft_deleted=include_soft_deleted)
         assert len(result) == expected
 
-    def test_find_running_by_automation(self, test_uow, automation):
+    def test_find_running_by_automation(self, test_uow, automation, run_repo, automation_repo):
         """Test find_running filtered by automation_id."""
-        repo_run = RunRepository(test_uow.session, test_uow)
-        repo_auto = AutomationRepository(test_uow.session, test_uow)
+        repo_run = run_repo
+        repo_auto = automation_repo
 
         other_auto = Automation(name="other-auto")
         other_auto = repo_auto.create(other_auto)
@@ -91,7 +99,7 @@ class TestRunRepositoryExtra:
         run2 = repo_run.create(run2)
         run_other = Run(automation_id=other_auto.id, status=ExecutionStatus.PROCESSING)
         run_other = repo_run.create(run_other)
-        test_uow.commit()
+        test_uow.session.flush()
 
         running = repo_run.find_running(automation_id=automation.id)
         assert len(running) == 2
@@ -104,16 +112,15 @@ class TestRunRepositoryExtra:
         (None, True, 5),
     ])
     def test_list_by_automation_filter_combinations(
-        self, test_uow, automation, status, include_soft_deleted, expected_count
+        self, test_uow, automation, status, include_soft_deleted, expected_count, run_repo
     ):
         """Test combination of status filter and soft-deleted inclusion."""
-        repo = RunRepository(test_uow.session, test_uow)
-        for i in range(5):
-            run = Run(automation_id=automation.id, status=ExecutionStatus.PENDING)
-            repo.create(run)
-        runs = repo.list()
-        repo.delete(runs[0].id, soft=True)
-        test_uow.commit()
+        repo = run_repo
+        created = repo.bulk_create(
+            [Run(automation_id=automation.id, status=ExecutionStatus.PENDING) for _ in range(5)]
+        )
+        repo.soft_delete_by_ids([created[0].id])
+        test_uow.session.flush()
         result = repo.list_by_automation(automation.id, status=status, include_soft_deleted=include_soft_deleted)
         assert len(result) == expected_count
 
@@ -122,48 +129,44 @@ class TestBatchExecutionRepositoryExtra:
     """Additional tests for BatchExecutionRepository."""
     @pytest.fixture
     def unique_runs(self, test_uow, automation):
-        """Create multiple runs for batch execution tests."""
-        repo = RunRepository(test_uow.session, test_uow)
-        runs = []
-        for i in range(5):
-            run = Run(automation_id=automation.id, status=ExecutionStatus.PENDING)
-            run = repo.create(run)
-            runs.append(run)
-        test_uow.commit()
-        return runs
-
-    @pytest.mark.parametrize("limit,offset,expected", [(0, 0, 0), (2, 0, 2), (2, 2, 2), (2, 10, 0)])
-    def test_list_by_batch_pagination(self, test_uow, batch, unique_runs, limit, offset, expected):
-        """Test pagination of list_by_batch."""
-        repo = BatchExecutionRepository(test_uow.session, test_uow)
-        for run in unique_runs:
-            be = BatchExecution(run_id=run.id, batch_id=batch.id)
-            repo.create(be)
-        test_uow.commit()
-        result = repo.list_by_batch(batch.id, limit=limit, offset=offset)
-        assert len(result) == expected
-
-    def test_list_by_batch_include_soft_deleted(self, test_uow, batch, unique_runs):
+        """Seed five runs with one Core INSERT and return their ids."""
+        ids = make_uuids(5)
+        test_uow.session.execute(
+            insert(RunModel),
+            [{"id": run_id, "automation_id": automation.id, "status": ExecutionStatus.PENDING} for run_id in ids],
+        )
+        test_uow.session.flush()
+        return ids
+
+    def test_list_by_batch_pagination(self, test_uow, batch, unique_runs, batch_execution_repo):
+        """Test pagination of list_by_batch across limit/offset combinations."""
+        repo = batch_execution_repo
+        repo.bulk_create([BatchExecution(run_id=run_id, batch_id=batch.id) for run_id in unique_runs])
+        test_uow.session.flush()
+        for limit, offset, expected in [(0, 0, 0), (2, 0, 2), (2, 2, 2), (2, 10, 0)]:
+            result = repo.list_by_batch(batch.id, limit=limit, offset=offset)
+            assert len(result) == expected
+
+    def test_list_by_batch_include_soft_deleted(self, test_uow, batch, unique_runs, batch_execution_repo):
         """Test include_soft_deleted for list_by_batch."""
-        repo = BatchExecutionRepository(test_uow.session, test_uow)
-        be = BatchExecution(run_id=unique_runs[0].id, batch_id=batch.id)
+        repo = batch_execution_repo
+        be = BatchExecution(run_id=unique_runs[0], batch_id=batch.id)
         repo.create(be)
-        test_uow.commit()
         repo.delete(be.id, soft=True)
-        test_uow.commit()
+        test_uow.session.flush()
         assert len(repo.list_by_batch(batch.id)) == 0
         assert len(repo.list_by_batch(batch.id, include_soft_deleted=True)) == 1
 
 
 class TestItemExecutionRepositoryFilters:
     """Test filter methods of ItemExecutionRepository."""
-    def test_list_pending_by_run_with_soft_deleted(self, test_uow, run, batch, batch_execution):
+    def test_list_pending_by_run_with_soft_deleted(self, test_uow, run, batch, batch_execution, item_repo, item_execution_repo):
         """Test list_pending_by_run with include_soft_deleted."""
-        item_repo = ItemRepository(test_uow.session, test_uow)
+        item_repo = item_repo
         item = Item(batch_id=batch.id, sequence_number=1)
         item = item_repo.create(item)
 
-        ie_repo = ItemExecutionRepository(test_uow.session, test_uow)
+        ie_repo = item_execution_repo
         ie = ItemExecution(
             run_id=run.id,
             batch_execution_id=batch_execution.id,
@@ -171,24 +174,22 @@ class TestItemExecutionRepositoryFilters:
             status=ExecutionStatus.PENDING,
         )
         ie = ie_repo.create(ie)
-        test_uow.commit()
+        test_uow.session.flush()
 
         ie_repo.delete(ie.id, soft=True)
-        test_uow.commit()
+        test_uow.session.flush()
 
         assert len(ie_repo.list_pending_by_run(run.id)) == 0
         assert len(ie_repo.list_pending_by_run(run.id, include_soft_deleted=True)) == 1
 
-    def test_list_failed_by_run_pagination(self, test_uow, run, batch_execution, batch):
+    def test_list_failed_by_run_pagination(self, test_uow, run, batch_execution, batch, item_execution_repo, item_repo):
         """Test pagination of list_failed_by_run."""
-        ie_repo = ItemExecutionRepository(test_uow.session, test_uow)
-        item_repo = ItemRepository(test_uow.session, test_uow)
+        ie_repo = item_execution_repo
+        item_repo = item_repo
 
-        items = []
-        for i in range(5):
-            item = Item(batch_id=batch.id, sequence_number=i)
-            item = item_repo.create(item)
-            items.append(item)
+        items = item_repo.bulk_create(
+            [Item(batch_id=batch.id, sequence_number=i) for i in range(5)]
+        )
 
         for item in items:
             ie = ItemExecution(
@@ -198,16 +199,16 @@ class TestItemExecutionRepositoryFilters:
                 status=ExecutionStatus.FAILED,
             )
             ie_repo.create(ie)
-        test_uow.commit()
+        test_uow.session.flush()
 
         assert len(ie_repo.list_failed_by_run(run.id, limit=2)) == 2
         assert len(ie_repo.list_failed_by_run(run.id, offset=2, limit=2)) == 2
         assert len(ie_repo.list_failed_by_run(run.id, offset=10)) == 0
 
-    def test_list_failed_by_run_include_soft_deleted(self, test_uow, run, batch_execution, batch):
+    def test_list_failed_by_run_include_soft_deleted(self, test_uow, run, batch_execution, batch, item_execution_repo, item_repo):
         """Test include_soft_deleted for list_failed_by_run."""
-        ie_repo = ItemExecutionRepository(test_uow.session, test_uow)
-        item_repo = ItemRepository(test_uow.session, test_uow)
+        ie_repo = item_execution_repo
+        item_repo = item_repo
 
         item = Item(batch_id=batch.id, sequence_number=1)
         item = item_repo.create(item)
@@ -218,17 +219,16 @@ class TestItemExecutionRepositoryFilters:
             status=ExecutionStatus.FAILED,
         )
         ie = ie_repo.create(ie)
-        test_uow.commit()
         ie_repo.delete(ie.id, soft=True)
-        test_uow.commit()
+        test_uow.session.flush()
 
         assert len(ie_repo.list_failed_by_run(run.id)) == 0
         assert len(ie_repo.list_failed_by_run(run.id, include_soft_deleted=True)) == 1
 
-    def test_count_by_status_edge_cases(self, test_uow, run, batch, batch_execution):
+    def test_count_by_status_edge_cases(self, test_uow, run, batch, batch_execution, item_execution_repo, item_repo):
         """Test count_by_status with zero and one entity."""
-        ie_repo = ItemExecutionRepository(test_uow.session, test_uow)
-        item_repo = ItemRepository(test_uow.session, test_uow)
+        ie_repo = item_execution_repo
+        item_repo = item_repo
 
         assert ie_repo.count_by_status(run.id, ExecutionStatus.PENDING) == 0
 
@@ -241,13 +241,13 @@ class TestItemExecutionRepositoryFilters:
             status=ExecutionStatus.PENDING,
         )
         ie_repo.create(ie)
-        test_uow.commit()
+        test_uow.session.flush()
         assert ie_repo.count_by_status(run.id, ExecutionStatus.PENDING) == 1
         assert ie_repo.count_by_status(run.id, ExecutionStatus.COMPLETED) == 0
 
-    def test_get_by_run_and_item_not_found(self, test_uow, run):
+    def test_get_by_run_and_item_not_found(self, test_uow, run, item_execution_repo):
         """Test get_by_run_and_item returns None for missing combination."""
-        repo = ItemExecutionRepository(test_uow.session, test_uow)
+        repo = item_execution_repo
         assert repo.get_by_run_and_item(run.id, uuid4()) is None
 
 
@@ -255,68 +255,46 @@ class TestItemExecutionRepositoryExtra:
     """Additional tests for ItemExecutionRepository."""
     @pytest.fixture
     def unique_items(self, test_uow, batch):
-        """Create multiple items for testing."""
-        repo = ItemRepository(test_uow.session, test_uow)
-        items = []
-        for i in range(5):
-            item = Item(batch_id=batch.id, sequence_number=i)
-            item = repo.create(item)
-            items.append(item)
-        test_uow.commit()
-        return items
+        """Seed five items with one Core INSERT and return their ids."""
+        ids = make_uuids(5)
+        test_uow.session.execute(
+            insert(ItemModel),
+            [{"id": item_id, "batch_id": batch.id, "sequence_number": i} for i, item_id in enumerate(ids)],
+        )
+        test_uow.session.flush()
+        return ids
 
-    @pytest.fixture
-    def item_execution_setup(self, test_uow):
-        """Create a full setup (automation, batch, run, batch_execution) for item execution tests."""
-        repo_auto = AutomationRepository(test_uow.session, test_uow)
-        repo_batch = BatchRepository(test_uow.session, test_uow)
-        repo_run = RunRepository(test_uow.session, test_uow)
-        repo_be = BatchExecutionRepository(test_uow.session, test_uow)
-
-        auto = Automation(name="setup-auto")
-        auto = repo_auto.create(auto)
-        batch = Batch(automation_id=auto.id, name="setup-batch")
-        batch = repo_batch.create(batch)
-        run = Run(automation_id=auto.id)
-        run = repo_run.create(run)
-        be = BatchExecution(run_id=run.id, batch_id=batch.id)
-        be = repo_be.create(be)
-        test_uow.commit()
-
-        return {"run": run, "batch_execution": be, "batch": batch, "automation": auto}
-
-    def test_list_by_batch_execution_pagination(self, test_uow, run, batch_execution, unique_items):
+    def test_list_by_batch_execution_pagination(self, test_uow, run, batch_execution, unique_items, item_execution_repo):
         """Test pagination of list_by_batch_execution."""
-        repo = ItemExecutionRepository(test_uow.session, test_uow)
-        for item in unique_items:
-            ie = ItemExecution(run_id=run.id, batch_execution_id=batch_execution.id, item_id=item.id)
+        repo = item_execution_repo
+        for item_id in unique_items:
+            ie = ItemExecution(run_id=run.id, batch_execution_id=batch_execution.id, item_id=item_id)
             repo.create(ie)
-        test_uow.commit()
+        test_uow.session.flush()
         assert len(repo.list_by_batch_execution(batch_execution.id, limit=2)) == 2
         assert len(repo.list_by_batch_execution(batch_execution.id, offset=10)) == 0
 
-    def test_list_by_batch_execution_include_soft_deleted(self, test_uow, run, batch_execution, unique_items):
+    def test_list_by_batch_execution_include_soft_deleted(self, test_uow, run, batch_execution, unique_items, item_execution_repo):
         """Test include_soft_deleted for list_by_batch_execution."""
-        repo = ItemExecutionRepository(test_uow.session, test_uow)
-        ie = ItemExecution(run_id=run.id, batch_execution_id=batch_execution.id, item_id=unique_items[0].id)
+        repo = item_execution_repo
+        ie = ItemExecution(run_id=run.id, batch_execution_id=batch_execution.id, item_id=unique_items[0])
         repo.create(ie)
-        test_uow.commit()
         repo.delete(ie.id, soft=True)
-        test_uow.commit()
+        test_uow.session.flush()
         assert len(repo.list_by_batch_execution(batch_execution.id)) == 0
         assert len(repo.list_by_batch_execution(batch_execution.id, include_soft_deleted=True)) == 1
 
-    def test_list_pending_by_run_pagination(self, test_uow, run, batch_execution, unique_items):
+    def test_list_pending_by_run_pagination(self, test_uow, run, batch_execution, unique_items, item_execution_repo):
         """Test pagination of list_pending_by_run."""
-        repo = ItemExecutionRepository(test_uow.session, test_uow)
-        for item in unique_items:
+        repo = item_execution_repo
+        for item_id in unique_items:
             ie = ItemExecution(
                 run_id=run.id,
                 batch_execution_id=batch_execution.id,
-                item_id=item.id,
+                item_id=item_id,
                 status=ExecutionStatus.PENDING,
             )
             repo.create(ie)
-        test_uow.commit()
+        test_uow.session.flush()
         assert len(repo.list_pending_by_run(run.id, limit=2)) == 2
         assert len(repo.list_pending_by_run(run.id, offset=10)) == 0
\ No newline at end of file
@@ -1,34 +1,49 @@
 import pytest
+from sqlalchemy import insert
+from sqlalchemy.orm import sessionmaker
 
 from src.project.domain.entities.orchestration import Engine, OrchestrationInstance
 from src.project.domain.enums import ExecutionStatus
+from src.project.infrastructure.database.models.orchestration.engine import EngineModel
+from src.project.infrastructure.database.models.orchestration.instance import OrchestrationInstanceModel
 from src.project.infrastructure.database.repositories.orchestration import (
     EngineRepository,
     OrchestrationInstanceRepository,
 )
+from tests.conftest import UoWHelper, make_uuids
+pytestmark = pytest.mark.db
 
 
 class TestEngineRepositoryExtra:
     """Additional tests for EngineRepository."""
-    @pytest.mark.parametrize("limit,offset,expected", [(0, 0, 0), (2, 0, 2), (2, 2, 2), (2, 10, 0)])
-    def test_list_by_type_pagination(self, test_uow, limit, offset, expected):
-        """Test pagination of list_by_type."""
-        repo = EngineRepository(test_uow.session, test_uow)
-        for i in range(5):
-            engine = Engine(name=f"engine{i}", type="docker")
-            repo.create(engine)
-        test_uow.commit()
-        result = repo.list_by_type("docker", limit=limit, offset=offset)
-        assert len(result) == expected
-
-    def test_list_by_type_include_soft_deleted(self, test_uow):
+    def test_list_by_type_pagination(self, test_uow, engine_repo):
+        """Test pagination of list_by_type across limit/offset combinations."""
+        repo = engine_repo
+        repo.bulk_create([Engine(name=f"engine{i}", type="docker") for i in range(5)])
+        test_uow.session.flush()
+        for limit, offset, expected in [(0, 0, 0), (2, 0, 2), (2, 2, 2), (2, 10, 0)]:
+            result = repo.list_by_type("docker", limit=limit, offset=offset)
+            assert len(result) == expected
+
+    def test_list_by_type_keyset(self, test_uow, engine_repo):
+        """Test keyset pagination pages through the same rows as a full list."""
+        repo = engine_repo
+        repo.bulk_create([Engine(name=f"engine{i}", type="docker") for i in range(5)])
+        test_uow.session.flush()
+
+        full = repo.list_by_type("docker")
+        page1 = repo.list_by_type("docker", limit=3)
+        page2 = repo.list_by_type("docker", limit=3, after=page1[-1].id)
+        assert [e.id for e in page1 + page2] == [e.id for e in full]
+        assert repo.list_by_type("docker", limit=3, after=page2[-1].id) == []
+
+    def test_list_by_type_include_soft_deleted(self, test_uow, engine_repo, orchestration_instance_repo):
         """Test include_soft_deleted for list_by_type."""
-        repo = EngineRepository(test_uow.session, test_uow)
+        repo = engine_repo
         engine = Engine(name="engine1", type="docker")
         repo.create(engine)
-        test_uow.commit()
         repo.delete(engine.id, soft=True)
-        test_uow.commit()
+        test_uow.session.flush()
         assert len(repo.list_by_type("docker")) == 0
         assert len(repo.list_by_type("docker", include_soft_deleted=True)) == 1
 
@@ -37,39 +52,42 @@ class TestOrchestrationInstanceRepositoryFilters:
     """Test filter methods of OrchestrationInstanceRepository."""
     @pytest.fixture
     def setup_instances(self, test_uow, engine_entity):
-        """Create multiple instances for pagination tests."""
-        repo = OrchestrationInstanceRepository(test_uow.session, test_uow)
-        instances = []
-        for i in range(5):
-            inst = OrchestrationInstance(
-                engine_id=engine_entity.id,
-                external_id=f"ext{i}",
-                status=ExecutionStatus.PENDING,
-                instance_metadata={},
-                duration_seconds=0,
-            )
-            inst = repo.create(inst)
-            instances.append(inst)
-        test_uow.commit()
-        return instances
+        """Seed five PENDING instances with one Core INSERT, skipping ORM bookkeeping."""
+        ids = make_uuids(5)
+        test_uow.session.execute(
+            insert(OrchestrationInstanceModel),
+            [
+                {
+                    "id": instance_id,
+                    "engine_id": engine_entity.id,
+                    "external_id": f"ext{i}",
+                    "status": ExecutionStatus.PENDING,
+                    "instance_metadata": {},
+                    "duration_seconds": 0,
+                }
+                for i, instance_id in enumerate(ids)
+            ],
+        )
+        test_uow.session.flush()
+        return ids
 
     @pytest.mark.parametrize("status,expected", [(ExecutionStatus.PENDING, 5), (ExecutionStatus.COMPLETED, 0)])
-    def test_list_by_status(self, test_uow, setup_instances, status, expected):
+    def test_list_by_status(self, test_uow, setup_instances, status, expected, orchestration_instance_repo):
         """Test list_by_status returns only instances with given status."""
-        repo = OrchestrationInstanceRepository(test_uow.session, test_uow)
+        repo = orchestration_instance_repo
         instances = repo.list_by_status(status)
         assert len(instances) == expected
 
-    @pytest.mark.parametrize("limit,offset,expected_count", [(0, 0, 0), (2, 2, 2), (10, 0, 5), (2, 10, 0)])
-    def test_list_by_engine_pagination(self, test_uow, engine_entity, setup_instances, limit, offset, expected_count):
-        """Test pagination of list_by_engine."""
-        repo = OrchestrationInstanceRepository(test_uow.session, test_uow)
-        instances = repo.list_by_engine(engine_entity.id, limit=limit, offset=offset)
-        assert len(instances) == expected_count
+    def test_list_by_engine_pagination(self, test_uow, engine_entity, setup_instances, orchestration_instance_repo):
+        """Test pagination of list_by_engine across limit/offset combinations."""
+        repo = orchestration_instance_repo
+        for limit, offset, expected_count in [(0, 0, 0), (2, 2, 2), (10, 0, 5), (2, 10, 0)]:
+            instances = repo.list_by_engine(engine_entity.id, limit=limit, offset=offset)
+            assert len(instances) == expected_count
 
-    def test_list_running_with_soft_deleted(self, test_uow, engine_entity):
+    def test_list_running_with_soft_deleted(self, test_uow, engine_entity, orchestration_instance_repo):
         """Test list_running respects include_soft_deleted."""
-        repo = OrchestrationInstanceRepository(test_uow.session, test_uow)
+        repo = orchestration_instance_repo
         inst = OrchestrationInstance(
             engine_id=engine_entity.id,
             external_id="ext",
@@ -78,9 +96,8 @@ class TestOrchestrationInstanceRepositoryFilters:
             duration_seconds=0,
         )
         inst = repo.create(inst)
-        test_uow.commit()
-        repo.delete(inst.id, soft=True)
-        test_uow.commit()
+        repo.soft_delete_by_ids([inst.id])
+        test_uow.session.flush()
 
         running = repo.list_running()
         assert len(running) == 0
@@ -91,9 +108,9 @@ class TestOrchestrationInstanceRepositoryFilters:
 
 class TestOrchestrationInstanceRepositoryExtra:
     """Additional tests for OrchestrationInstanceRepository."""
-    def test_get_by_engine_and_external_include_soft_deleted(self, test_uow, engine_entity):
+    def test_get_by_engine_and_external_include_soft_deleted(self, test_uow, engine_entity, orchestration_instance_repo):
         """Test get_by_engine_and_external with include_soft_deleted flag."""
-        repo = OrchestrationInstanceRepository(test_uow.session, test_uow)
+        repo = orchestration_instance_repo
         inst = OrchestrationInstance(
             engine_id=engine_entity.id,
             external_id="ext",
@@ -102,9 +119,8 @@ class TestOrchestrationInstanceRepositoryExtra:
             duration_seconds=0,
         )
         repo.create(inst)
-        test_uow.commit()
         repo.delete(inst.id, soft=True)
-        test_uow.commit()
+        test_uow.session.flush()
         assert repo.get_by_engine_and_external(engine_entity.id, "ext") is None
         found = repo.get_by_engine_and_external(engine_entity.id, "ext", include_soft_deleted=True)
         assert found is not None
@@ -115,45 +131,28 @@ class TestOrchestrationInstanceRepositoryExtra:
         [(ExecutionStatus.PENDING, False, 4), (ExecutionStatus.PENDING, True, 5)],
     )
     def test_list_by_status_filter_combinations(
-        self, test_uow, engine_entity, status, include_soft_deleted, expected_count
+        self, test_uow, engine_entity, status, include_soft_deleted, expected_count, orchestration_instance_repo
     ):
         """Test combination of status filter and soft-deleted inclusion."""
-        repo = OrchestrationInstanceRepository(test_uow.session, test_uow)
-        for i in range(5):
-            inst = OrchestrationInstance(
+        repo = orchestration_instance_repo
+        created = repo.bulk_create([
+            OrchestrationInstance(
                 engine_id=engine_entity.id,
                 external_id=f"ext{i}",
                 status=ExecutionStatus.PENDING,
                 instance_metadata={},
                 duration_seconds=0,
             )
-            repo.create(inst)
-        instances = repo.list()
-        repo.delete(instances[0].id, soft=True)
-        test_uow.commit()
+            for i in range(5)
+        ])
+        repo.soft_delete_by_ids([created[0].id])
+        test_uow.session.flush()
         result = repo.list_by_status(status, include_soft_deleted=include_soft_deleted)
         assert len(result) == expected_count
 
-    @pytest.mark.parametrize("limit,offset,expected", [(0, 0, 0), (2, 0, 2), (2, 2, 2), (2, 10, 0)])
-    def test_list_by_engine_pagination(self, test_uow, engine_entity, limit, offset, expected):
-        """Test pagination of list_by_engine."""
-        repo = OrchestrationInstanceRepository(test_uow.session, test_uow)
-        for i in range(5):
-            inst = OrchestrationInstance(
-                engine_id=engine_entity.id,
-                external_id=f"ext{i}",
-                status=ExecutionStatus.PENDING,
-                instance_metadata={},
-                duration_seconds=0,
-            )
-            repo.create(inst)
-        test_uow.commit()
-        result = repo.list_by_engine(engine_entity.id, limit=limit, offset=offset)
-        assert len(result) == expected
-
-    def test_list_by_engine_include_soft_deleted(self, test_uow, engine_entity):
+    def test_list_by_engine_include_soft_deleted(self, test_uow, engine_entity, orchestration_instance_repo):
         """Test list_by_engine with include_soft_deleted."""
-        repo = OrchestrationInstanceRepository(test_uow.session, test_uow)
+        repo = orchestration_instance_repo
         inst = OrchestrationInstance(
             engine_id=engine_entity.id,
             external_id="ext",
@@ -162,32 +161,14 @@ class TestOrchestrationInstanceRepositoryExtra:
             duration_seconds=0,
         )
         repo.create(inst)
-        test_uow.commit()
         repo.delete(inst.id, soft=True)
-        test_uow.commit()
+        test_uow.session.flush()
         assert len(repo.list_by_engine(engine_entity.id)) == 0
         assert len(repo.list_by_engine(engine_entity.id, include_soft_deleted=True)) == 1
 
-    @pytest.mark.parametrize("limit,offset,expected", [(0, 0, 0), (2, 0, 2), (2, 2, 2), (2, 10, 0)])
-    def test_list_by_status_pagination(self, test_uow, engine_entity, limit, offset, expected):
-        """Test pagination of list_by_status."""
-        repo = OrchestrationInstanceRepository(test_uow.session, test_uow)
-        for i in range(5):
-            inst = OrchestrationInstance(
-                engine_id=engine_entity.id,
-                external_id=f"ext{i}",
-                status=ExecutionStatus.PENDING,
-                instance_metadata={},
-                duration_seconds=0,
-            )
-            repo.create(inst)
-        test_uow.commit()
-        result = repo.list_by_status(ExecutionStatus.PENDING, limit=limit, offset=offset)
-        assert len(result) == expected
-
-    def test_list_running_include_soft_deleted(self, test_uow, engine_entity):
+    def test_list_running_include_soft_deleted(self, test_uow, engine_entity, orchestration_instance_repo):
         """Test list_running with include_soft_deleted."""
-        repo = OrchestrationInstanceRepository(test_uow.session, test_uow)
+        repo = orchestration_instance_repo
         inst = OrchestrationInstance(
             engine_id=engine_entity.id,
             external_id="ext",
@@ -196,32 +177,14 @@ class TestOrchestrationInstanceRepositoryExtra:
             duration_seconds=0,
         )
         repo.create(inst)
-        test_uow.commit()
         repo.delete(inst.id, soft=True)
-        test_uow.commit()
+        test_uow.session.flush()
         assert len(repo.list_running()) == 0
         assert len(repo.list_running(include_soft_deleted=True)) == 1
 
-    @pytest.mark.parametrize("limit,offset,expected", [(0, 0, 0), (2, 0, 2), (2, 2, 2), (2, 10, 0)])
-    def test_list_running_pagination(self, test_uow, engine_entity, limit, offset, expected):
-        """Test pagination of list_running."""
-        repo = OrchestrationInstanceRepository(test_uow.session, test_uow)
-        for i in range(5):
-            inst = OrchestrationInstance(
-                engine_id=engine_entity.id,
-                external_id=f"ext{i}",
-                status=ExecutionStatus.PROCESSING,
-                instance_metadata={},
-                duration_seconds=0,
-            )
-            repo.create(inst)
-        test_uow.commit()
-        result = repo.list_running(limit=limit, offset=offset)
-        assert len(result) == expected
-
-    def test_list_by_engine(self, test_uow, engine_entity):
+    def test_list_by_engine(self, test_uow, engine_entity, orchestration_instance_repo):
         """Test list_by_engine returns all instances for an engine."""
-        repo = OrchestrationInstanceRepository(test_uow.session, test_uow)
+        repo = orchestration_instance_repo
         inst1 = OrchestrationInstance(
             engine_id=engine_entity.id,
             external_id="ext1",
@@ -238,38 +201,32 @@ class TestOrchestrationInstanceRepositoryExtra:
         )
         repo.create(inst1)
         repo.create(inst2)
-        test_uow.commit()
+        test_uow.session.flush()
 
         results = repo.list_by_engine(engine_entity.id)
         assert len(results) == 2
         assert {i.external_id for i in results} == {"ext1", "ext2"}
 
-    def test_list_by_status(self, test_uow):
+    def test_list_by_status(self, test_uow, engine_entity, orchestration_instance_repo):
         """Test list_by_status returns instances with given status."""
-        repo_engine = EngineRepository(test_uow.session, test_uow)
-        repo_instance = OrchestrationInstanceRepository(test_uow.session, test_uow)
-
-        engine1 = Engine(name="engine1", type="test")
-        engine1 = repo_engine.create(engine1)
-        engine2 = Engine(name="engine2", type="test")
-        engine2 = repo_engine.create(engine2)
+        repo_instance = orchestration_instance_repo
 
         inst1 = OrchestrationInstance(
-            engine_id=engine1.id,
+            engine_id=engine_entity.id,
             external_id="ext1",
             status=ExecutionStatus.PENDING,
             instance_metadata={},
             duration_seconds=0,
         )
         inst2 = OrchestrationInstance(
-            engine_id=engine2.id,
+            engine_id=engine_entity.id,
             external_id="ext2",
             status=ExecutionStatus.PROCESSING,
             instance_metadata={},
             duration_seconds=0,
         )
         inst3 = OrchestrationInstance(
-            engine_id=engine1.id,
+            engine_id=engine_entity.id,
             external_id="ext3",
             status=ExecutionStatus.PENDING,
             instance_metadata={},
@@ -278,7 +235,7 @@ class TestOrchestrationInstanceRepositoryExtra:
         repo_instance.create(inst1)
         repo_instance.create(inst2)
         repo_instance.create(inst3)
-        test_uow.commit()
+        test_uow.session.flush()
 
         pending = repo_instance.list_by_status(ExecutionStatus.PENDING)
         assert len(pending) == 2
@@ -286,32 +243,26 @@ class TestOrchestrationInstanceRepositoryExtra:
         assert len(processing) == 1
         assert processing[0].external_id == "ext2"
 
-    def test_list_running(self, test_uow):
+    def test_list_running(self, test_uow, engine_entity, orchestration_instance_repo):
         """Test list_running returns instances with PROCESSING or RETRYING status."""
-        repo_engine = EngineRepository(test_uow.session, test_uow)
-        repo_instance = OrchestrationInstanceRepository(test_uow.session, test_uow)
-
-        engine1 = Engine(name="engine1", type="test")
-        engine1 = repo_engine.create(engine1)
-        engine2 = Engine(name="engine2", type="test")
-        engine2 = repo_engine.create(engine2)
+        repo_instance = orchestration_instance_repo
 
         inst1 = OrchestrationInstance(
-            engine_id=engine1.id,
+            engine_id=engine_entity.id,
             external_id="ext1",
             status=ExecutionStatus.PROCESSING,
             instance_metadata={},
             duration_seconds=0,
         )
         inst2 = OrchestrationInstance(
-            engine_id=engine2.id,
+            engine_id=engine_entity.id,
             external_id="ext2",
             status=ExecutionStatus.RETRYING,
             instance_metadata={},
             duration_seconds=0,
         )
         inst3 = OrchestrationInstance(
-            engine_id=engine1.id,
+            engine_id=engine_entity.id,
             external_id="ext3",
             status=ExecutionStatus.PENDING,
             instance_metadata={},
@@ -320,8 +271,69 @@ class TestOrchestrationInstanceRepositoryExtra:
         repo_instance.create(inst1)
         repo_instance.create(inst2)
         repo_instance.create(inst3)
-        test_uow.commit()
+        test_uow.session.flush()
 
         running = repo_instance.list_running()
         assert len(running) == 2
-        assert {i.external_id for i in running} == {"ext1", "ext2"}
\ No newline at end of file
+        assert {i.external_id for i in running} == {"ext1", "ext2"}
+
+
+@pytest.fixture(scope="class")
+def pagination_engine(db_engine):
+    """Commit one engine with five PROCESSING instances for the class.
+
+    The class scope cannot use the function-scoped unit of work, so the
+    rows are committed through a dedicated session (mirroring the module
+    seed layer in conftest) and removed again at class teardown.
+
+    Args:
+        db_engine (sqlalchemy.engine.Engine): The session-scoped engine.
+
+    Yields:
+        Engine: The persisted engine owning the five instances.
+    """
+    Session = sessionmaker(bind=db_engine)
+    session = Session()
+    uow = UoWHelper(session)
+    engine = EngineRepository(session, uow).create(Engine(name="pagination-engine", type="docker"))
+    OrchestrationInstanceRepository(session, uow).bulk_create([
+        OrchestrationInstance(
+            engine_id=engine.id,
+            external_id=f"page-ext{i}",
+            status=ExecutionStatus.PROCESSING,
+            instance_metadata={},
+            duration_seconds=0,
+        )
+        for i in range(5)
+    ])
+    uow.commit()
+    session.close()
+    yield engine
+    with db_engine.begin() as connection:
+        connection.execute(
+            OrchestrationInstanceModel.__table__.delete().where(
+                OrchestrationInstanceModel.engine_id == engine.id
+            )
+        )
+        connection.execute(EngineModel.__table__.delete().where(EngineModel.id == engine.id))
+
+
+class TestOrchestrationInstancePagination:
+    """Shared pagination behavior of the instance list methods.
+
+    ``list_by_engine``, ``list_by_status`` and ``list_running`` apply the
+    same limit/offset handling, so one seeded class covers all three
+    instead of re-inserting five instances per parametrize case.
+    """
+    @pytest.mark.parametrize("method", ["list_by_engine", "list_by_status", "list_running"])
+    def test_pagination(self, pagination_engine, method, orchestration_instance_repo):
+        """Test limit/offset handling across the three list methods."""
+        repo = orchestration_instance_repo
+        args = {
+            "list_by_engine": (pagination_engine.id,),
+            "list_by_status": (ExecutionStatus.PROCESSING,),
+            "list_running": (),
+        }[method]
+        for limit, offset, expected in [(0, 0, 0), (2, 0, 2), (2, 2, 2), (2, 10, 0)]:
+            result = getattr(repo, method)(*args, limit=limit, offset=offset)
+            assert len(result) == expected
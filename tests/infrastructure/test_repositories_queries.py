@@ -2,18 +2,19 @@ from uuid import uuid4
 
 import pytest
 
-from src.project.infrastructure.database.repositories.definition import AutomationRepository
 from src.project.domain.entities import Automation
 from src.project.infrastructure.exceptions.repository import RepositoryError
 
+pytestmark = pytest.mark.db
 
-def test_list_with_filters(db_session, uow_mock):
+
+def test_list_with_filters(query_repo):
     """Test that list() filters results correctly based on keyword arguments."""
-    repo = AutomationRepository(db_session, uow_mock)
-    auto1 = Automation(name="filter1", description="desc1")
-    auto2 = Automation(name="filter2", description="desc2")
-    repo.create(auto1)
-    repo.create(auto2)
+    repo = query_repo
+    repo.bulk_create([
+        Automation(name="filter1", description="desc1"),
+        Automation(name="filter2", description="desc2"),
+    ])
 
     results = repo.list(name="filter1")
     assert len(results) == 1
@@ -30,34 +31,32 @@ def test_list_with_filters(db_session, uow_mock):
     assert len(results) == 0
 
 
-def test_list_invalid_filter_field(db_session, uow_mock):
+def test_list_invalid_filter_field(query_repo):
     """Test that passing an invalid field name raises RepositoryError."""
-    repo = AutomationRepository(db_session, uow_mock)
     with pytest.raises(RepositoryError, match="Invalid filter field"):
-        repo.list(nonexistent_field="value")
+        query_repo.list(nonexistent_field="value")
 
 
-def test_exists(db_session, uow_mock):
+def test_exists(query_repo):
     """Test the exists() method."""
-    repo = AutomationRepository(db_session, uow_mock)
+    repo = query_repo
     auto = Automation(name="exists")
     created = repo.create(auto)
     assert repo.exists(created.id) is True
     assert repo.exists(uuid4()) is False
 
 
-def test_count(db_session, uow_mock):
+def test_count(query_repo):
     """Test the count() method with and without filters."""
-    repo = AutomationRepository(db_session, uow_mock)
-    repo.create(Automation(name="count1"))
-    repo.create(Automation(name="count2"))
+    repo = query_repo
+    repo.bulk_create([Automation(name="count1"), Automation(name="count2")])
     assert repo.count() == 2
     assert repo.count(name="count1") == 1
 
 
-def test_soft_delete_filtering(db_session, uow_mock):
+def test_soft_delete_filtering(query_repo):
     """Test that soft-deleted entities are excluded by default but can be included."""
-    repo = AutomationRepository(db_session, uow_mock)
+    repo = query_repo
     auto = Automation(name="soft")
     created = repo.create(auto)
     repo.delete(created.id, soft=True)
@@ -4,48 +4,28 @@ from src.project.infrastructure.uow import UnitOfWork, EventBus
 from src.project.domain.entities import Automation
 from src.project.infrastructure.exceptions.repository import ConcurrencyError
 
+pytestmark = [pytest.mark.db, pytest.mark.slow]
 
-def test_update_with_stale_version(db_config):
-    """Test that updating an entity with a stale version raises ConcurrencyError."""
-    event_bus = EventBus()
-    uow_create = UnitOfWork(db_config, event_bus)
-    with uow_create:
-        auto = Automation(name="test")
-        uow_create.automations.create(auto)
-        auto_id = auto.id
 
-    uow1 = UnitOfWork(db_config, event_bus)
-    uow1.__enter__()
-    auto1 = uow1.automations.get(auto_id)
-    auto1.name = "updated by other"
-    uow1.automations.update(auto1.id, auto1)
+@pytest.mark.parametrize("op", ["update", "soft_delete", "hard_delete"])
+def test_stale_version_raises_concurrency(db_config, op):
+    """Test that operating on an entity with a stale version raises ConcurrencyError.
 
-    uow2 = UnitOfWork(db_config, event_bus)
-    uow2.__enter__()
-    auto2 = uow2.automations.get(auto_id)
-    auto2.name = "my update"
-
-    uow1.commit()
-
-    with pytest.raises(ConcurrencyError):
-        uow2.automations.update(auto2.id, auto2)
-        uow2.commit()
-    uow2.__exit__(None, None, None)
-
-
-def test_soft_delete_with_stale_version(db_config):
-    """Test that soft-deleting an entity with a stale version raises ConcurrencyError."""
+    Covers update, soft delete, and hard delete through one shared arrange
+    phase: seed a row, let uow1 bump its version, and have uow2 (holding the
+    stale snapshot) attempt the operation. The seed row is created per case
+    because the committing-engine fixture wipes all rows between tests.
+    """
     event_bus = EventBus()
-    uow_create = UnitOfWork(db_config, event_bus)
-    with uow_create:
-        auto = Automation(name="soft-del")
+    with UnitOfWork(db_config, event_bus) as uow_create:
+        auto = Automation(name=f"stale-{op}")
         uow_create.automations.create(auto)
         auto_id = auto.id
 
     uow1 = UnitOfWork(db_config, event_bus)
     uow1.__enter__()
     auto1 = uow1.automations.get(auto_id)
-    auto1.name = "changed"
+    auto1.name = "updated by other"
     uow1.automations.update(auto1.id, auto1)
 
     uow2 = UnitOfWork(db_config, event_bus)
@@ -55,31 +35,10 @@ def test_soft_delete_with_stale_version(db_config):
     uow1.commit()
 
     with pytest.raises(ConcurrencyError):
-        uow2.automations.delete(auto_id, soft=True)
+        if op == "update":
+            auto2.name = "my update"
+            uow2.automations.update(auto2.id, auto2)
+            uow2.commit()
+        else:
+            uow2.automations.delete(auto_id, soft=op == "soft_delete")
     uow2.__exit__(None, None, None)
-
-
-def test_hard_delete_with_stale_version(db_config):
-    """Test that hard-deleting an entity with a stale version raises ConcurrencyError."""
-    event_bus = EventBus()
-    uow_create = UnitOfWork(db_config, event_bus)
-    with uow_create:
-        auto = Automation(name="hard-del")
-        uow_create.automations.create(auto)
-        auto_id = auto.id
-
-    uow1 = UnitOfWork(db_config, event_bus)
-    uow1.__enter__()
-    auto1 = uow1.automations.get(auto_id)
-    auto1.name = "changed"
-    uow1.automations.update(auto1.id, auto1)
-
-    uow2 = UnitOfWork(db_config, event_bus)
-    uow2.__enter__()
-    auto2 = uow2.automations.get(auto_id)
-
-    uow1.commit()
-
-    with pytest.raises(ConcurrencyError):
-        uow2.automations.delete(auto_id, soft=False)
-    uow2.__exit__(None, None, None)
\ No newline at end of file
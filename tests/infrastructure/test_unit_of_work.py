@@ -1,9 +1,13 @@
 import pytest
+from sqlalchemy import select
 
 from src.project.infrastructure.uow import UnitOfWork, EventBus
+from src.project.infrastructure.database.models.definition.automation import AutomationModel
 from src.project.domain.entities import Automation, Run
 from src.project.domain.events import RunCompleted
 
+pytestmark = pytest.mark.db
+
 
 @pytest.fixture
 def event_bus():
@@ -18,8 +22,10 @@ def test_uow_commit(db_config, event_bus):
         auto = Automation(name="test")
         uow.automations.create(auto)
 
-    with UnitOfWork(db_config, event_bus) as uow2:
-        fetched = uow2.automations.get_by_name("test")
+    with db_config.engine.connect() as conn:
+        fetched = conn.execute(
+            select(AutomationModel.id).where(AutomationModel.name == "test")
+        ).first()
         assert fetched is not None
 
 
@@ -32,8 +38,10 @@ def test_uow_rollback_on_exception(db_config, event_bus):
             uow.automations.create(auto)
             raise ValueError("force rollback")
 
-    with UnitOfWork(db_config, event_bus) as uow2:
-        fetched = uow2.automations.get_by_name("test")
+    with db_config.engine.connect() as conn:
+        fetched = conn.execute(
+            select(AutomationModel.id).where(AutomationModel.name == "test")
+        ).first()
         assert fetched is None
 
 
@@ -1,9 +1,13 @@
 import pytest
+from sqlalchemy import select
 
 from src.project.infrastructure.uow import UnitOfWork, EventBus
+from src.project.infrastructure.database.models.definition.automation import AutomationModel
 from src.project.domain.entities import Automation, Run
 from src.project.domain.events import RunCompleted
 
+pytestmark = pytest.mark.db
+
 
 @pytest.fixture
 def event_bus():
@@ -76,8 +80,10 @@ def test_transaction_context_manager(db_config, event_bus):
             auto = Automation(name="tx")
             uow.automations.create(auto)
 
-    with UnitOfWork(db_config, event_bus) as uow2:
-        fetched = uow2.automations.get_by_name("tx")
+    with db_config.engine.connect() as conn:
+        fetched = conn.execute(
+            select(AutomationModel.id).where(AutomationModel.name == "tx")
+        ).first()
         assert fetched is not None
 
 
@@ -90,6 +96,8 @@ def test_transaction_rollback_on_exception(db_config, event_bus):
                 auto = Automation(name="tx-rollback")
                 uow.automations.create(auto)
                 raise RuntimeError("boom")
-    with UnitOfWork(db_config, event_bus) as uow2:
-        fetched = uow2.automations.get_by_name("tx-rollback")
+    with db_config.engine.connect() as conn:
+        fetched = conn.execute(
+            select(AutomationModel.id).where(AutomationModel.name == "tx-rollback")
+        ).first()
         assert fetched is None
\ No newline at end of file
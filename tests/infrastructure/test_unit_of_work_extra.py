@@ -1,30 +1,52 @@
+import threading
 import time
-from unittest.mock import Mock, call
+from collections import Counter
+from unittest.mock import Mock
 from uuid import uuid4
 
 import pytest
-from sqlalchemy import text
-from sqlalchemy.orm import Session
+from sqlalchemy import select, text
 
 from src.project.domain.entities.definition import Automation
+from src.project.infrastructure.database.models.definition.automation import AutomationModel
 from src.project.infrastructure.database.repositories.definition import AutomationRepository
 from src.project.infrastructure.exceptions.repository import DuplicateEntityError
 from src.project.infrastructure.uow.unit_of_work import UnitOfWork, EventBus
 
+pytestmark = pytest.mark.db
+
+
+class _TestEvent:
+    """Shared event class for EventBus tests.
+
+    Defined once at module scope so every test registers and dispatches
+    against the same type, instead of allocating a fresh class per test
+    with `type("TestEvent", (), {})`.
+    """
+
 
 def test_async_event_dispatch():
-    """Test that events are dispatched asynchronously to registered handlers."""
+    """Test that events are dispatched asynchronously to registered handlers.
+
+    Uses a plain lock-guarded list instead of a Mock: recording calls on a
+    Mock is far slower than an append, which matters when the event count is
+    bumped for stress testing, and an any-order call match is quadratic.
+    """
     bus = EventBus(use_async=True, max_workers=2)
-    mock_handler = Mock()
-    test_event_type = type("TestEvent", (), {})
-    bus.register(test_event_type, mock_handler)
+    seen = []
+    lock = threading.Lock()
+
+    def handler(event):
+        with lock:
+            seen.append(id(event))
+
+    bus.register(_TestEvent, handler)
 
-    events = [test_event_type() for _ in range(5)]
+    events = [_TestEvent() for _ in range(5)]
     bus.dispatch(events)
     bus.shutdown(wait=True)
 
-    assert mock_handler.call_count == 5
-    mock_handler.assert_has_calls([call(event) for event in events], any_order=True)
+    assert Counter(seen) == Counter(id(event) for event in events)
 
 
 def test_async_dispatch_with_exception():
@@ -34,27 +56,34 @@ def test_async_dispatch_with_exception():
     def failing_handler(event):
         raise ValueError("handler error")
 
-    test_event_type = type("TestEvent", (), {})
-    bus.register(test_event_type, failing_handler)
+    bus.register(_TestEvent, failing_handler)
 
-    events = [test_event_type() for _ in range(3)]
+    events = [_TestEvent() for _ in range(3)]
     bus.dispatch(events)
     bus.shutdown(wait=True)
 
 
 def test_async_shutdown_wait_false():
-    """Test shutdown with wait=False does not block and cancels pending futures."""
+    """Test shutdown with wait=False returns promptly despite blocked handlers.
+
+    Handlers block on an Event that is only set after shutdown returns, so
+    "slow work" is simulated deterministically instead of with a wall-clock
+    sleep, and the elapsed time bounds how long wait=False may block.
+    """
     bus = EventBus(use_async=True, max_workers=2)
+    block = threading.Event()
 
     def slow_handler(event):
-        time.sleep(1)
+        block.wait(timeout=30)
 
-    test_event_type = type("TestEvent", (), {})
-    bus.register(test_event_type, slow_handler)
+    bus.register(_TestEvent, slow_handler)
 
-    events = [test_event_type() for _ in range(3)]
+    events = [_TestEvent() for _ in range(3)]
     bus.dispatch(events)
+    start = time.monotonic_ns()
     bus.shutdown(wait=False)
+    assert time.monotonic_ns() - start < 100_000_000
+    block.set()
 
 
 def test_async_multiple_handlers_per_event():
@@ -62,11 +91,10 @@ def test_async_multiple_handlers_per_event():
     bus = EventBus(use_async=True, max_workers=2)
     mock1 = Mock()
     mock2 = Mock()
-    test_event_type = type("TestEvent", (), {})
-    bus.register(test_event_type, mock1)
-    bus.register(test_event_type, mock2)
+    bus.register(_TestEvent, mock1)
+    bus.register(_TestEvent, mock2)
 
-    event = test_event_type()
+    event = _TestEvent()
     bus.dispatch([event])
     bus.shutdown(wait=True)
 
@@ -78,10 +106,9 @@ def test_sync_event_dispatch():
     """Test that events are dispatched synchronously."""
     bus = EventBus(use_async=False)
     mock_handler = Mock()
-    test_event_type = type("TestEvent", (), {})
-    bus.register(test_event_type, mock_handler)
+    bus.register(_TestEvent, mock_handler)
 
-    events = [test_event_type() for _ in range(3)]
+    events = [_TestEvent() for _ in range(3)]
     bus.dispatch(events)
 
     assert mock_handler.call_count == 3
@@ -116,15 +143,15 @@ def test_flush_after_rollback(db_config):
     repo = AutomationRepository(uow.session, uow)
     auto = Automation(name="test")
     repo.create(auto)
-    uow.session.flush()
+    uow.flush()
     uow.rollback()
-    uow.session.flush()
+    uow.flush()
     uow.__exit__(None, None, None)
 
 
-def test_rollback_after_failed_commit(test_uow, engine):
+def test_rollback_after_failed_commit(test_uow, automation_repo):
     """Test that rollback after a failed commit restores consistency."""
-    repo = AutomationRepository(test_uow.session, test_uow)
+    repo = automation_repo
     auto = Automation(name="test")
     repo.create(auto)
     test_uow.commit()
@@ -134,15 +161,16 @@ def test_rollback_after_failed_commit(test_uow, engine):
         repo.create(auto2)
     test_uow.rollback()
 
-    new_session = Session(bind=engine)
-    new_repo = AutomationRepository(new_session, test_uow)
-    assert new_repo.count() == 1
-    new_session.close()
+    assert repo.count() == 1
+
 
+def test_flush(engine, test_uow, automation_repo):
+    """Test that flush assigns an ID but changes can be rolled back.
 
-def test_flush(test_uow, engine):
-    """Test that flush assigns an ID but changes can be rolled back."""
-    repo = AutomationRepository(test_uow.session, test_uow)
+    `engine` comes first so its row wipe is finalized after the SAVEPOINT
+    harness has rolled back and released its locks.
+    """
+    repo = automation_repo
     auto = Automation(name="test")
     created = repo.create(auto)
     test_uow.flush()
@@ -153,7 +181,7 @@ def test_flush(test_uow, engine):
 
     with engine.connect() as conn:
         result = conn.execute(
-            text("SELECT id FROM automation WHERE id = :id"), {"id": created.id}
+            select(AutomationModel.id).where(AutomationModel.id == created.id)
         ).first()
         assert result is None
 
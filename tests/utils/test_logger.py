@@ -1,4 +1,5 @@
 import logging
+from uuid import uuid4
 
 import pytest
 
@@ -22,6 +23,37 @@ def clean_logger():
     logger.propagate = True
 
 
+@pytest.fixture(scope="module")
+def shared_handler():
+    """Provide a single `RichTqdmHandler` reused by every test in this module.
+
+    Constructing the handler builds two Rich consoles, which is the expensive
+    part of `setup_logger`. Since `setup_logger` skips handler creation when a
+    `RichTqdmHandler` is already attached, tests can pre-attach this shared
+    instance and pay the construction cost once per module.
+
+    Returns:
+        RichTqdmHandler: The shared handler instance.
+    """
+    return RichTqdmHandler()
+
+
+@pytest.fixture
+def unique_logger(shared_handler):
+    """Provide a uniquely-named logger with the shared handler pre-attached.
+
+    A fresh name per test means the logger is never looked up again, so no
+    per-test `handlers.clear()` teardown is needed and tests cannot leak
+    state into each other through the logging manager.
+
+    Returns:
+        logging.Logger: A logger with the shared `RichTqdmHandler` attached.
+    """
+    logger = logging.getLogger(f"t{uuid4().hex}")
+    logger.addHandler(shared_handler)
+    return logger
+
+
 def test_setup_logger_defaults(clean_logger):
     """Test that `setup_logger` creates a logger with default settings.
 
@@ -35,61 +67,57 @@ def test_setup_logger_defaults(clean_logger):
     assert logger.propagate is False
 
 
-def test_setup_logger_with_custom_level():
+def test_setup_logger_with_custom_level(unique_logger):
     """Test that `setup_logger` respects a custom logging level.
 
     Creates a logger with DEBUG level and asserts its level is set correctly.
     """
-    logger = setup_logger("custom_level", level=logging.DEBUG)
+    logger = setup_logger(unique_logger.name, level=logging.DEBUG)
     assert logger.level == logging.DEBUG
-    logger.handlers.clear()
 
 
-def test_logger_does_not_duplicate_handlers():
+def test_logger_does_not_duplicate_handlers(unique_logger):
     """Test that calling `setup_logger` twice on the same name does not add duplicate handlers.
 
     Ensures the second call does not increase the number of handlers attached to the logger.
     """
-    logger1 = setup_logger("dup_test")
+    logger1 = setup_logger(unique_logger.name)
     handler_count = len(logger1.handlers)
-    logger2 = setup_logger("dup_test")
+    logger2 = setup_logger(unique_logger.name)
     assert len(logger2.handlers) == handler_count
-    logger1.handlers.clear()
-    logger2.handlers.clear()
 
 
-def test_logger_emits_messages(caplog):
+def test_logger_emits_messages(caplog, unique_logger):
     """Test that the logger actually logs messages.
 
     Uses `caplog` to capture log records and verifies that an INFO message appears.
     """
     caplog.set_level(logging.INFO)
-    logger = setup_logger("test_emit")
+    logger = setup_logger(unique_logger.name)
     logger.propagate = True
     test_message = "hello world"
     logger.info(test_message)
     assert any(test_message in record.message for record in caplog.records)
-    logger.handlers.clear()
 
 
-def test_logger_propagate_false_by_default():
+def test_logger_propagate_false_by_default(unique_logger):
     """Test that logger.propagate is set to False by default.
 
     Checks that newly created loggers do not propagate messages to parent loggers.
     """
-    logger = setup_logger("prop_test")
+    logger = setup_logger(unique_logger.name)
     assert logger.propagate is False
-    logger.handlers.clear()
 
 
 def test_custom_format_passed_to_handler():
     """Test that a custom format string is correctly passed to the handler.
 
     Creates a logger with a custom format and verifies that the handler's formatter
-    uses that exact format string.
+    uses that exact format string. This test builds its own handler (rather than
+    reusing the shared one) because formatter assignment only happens when
+    `setup_logger` constructs the handler itself.
     """
     custom_fmt = "%(levelname)s - %(message)s"
-    logger = setup_logger("fmt_test", fmt=custom_fmt)
+    logger = setup_logger(f"t{uuid4().hex}", fmt=custom_fmt)
     handler = logger.handlers[0]
     assert handler.formatter._fmt == custom_fmt
-    logger.handlers.clear()
\ No newline at end of file